@@ -3,17 +3,44 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--jobs N]
 """
 
 import argparse
-import shutil
-import subprocess
+import concurrent.futures
+import contextlib
 import sys
 import tempfile
 import defusedxml.minidom
 import zipfile
 from pathlib import Path
+from xml.parsers import expat
+
+from defusedxml import EntitiesForbidden, ExternalReferenceForbidden
+
+try:
+    from . import soffice  # Imported as part of a package (ooxml.scripts.pack)
+except ImportError:
+    import soffice  # Run as a script
+
+# Media that is already compressed; deflating it again costs time and saves nothing
+STORED_EXTENSIONS = {
+    ".jpeg",
+    ".jpg",
+    ".png",
+    ".gif",
+    ".mp3",
+    ".m4a",
+    ".mp4",
+    ".mov",
+    ".wmv",
+    ".avi",
+    ".wdp",
+    ".zip",
+    ".docx",
+    ".pptx",
+    ".xlsx",
+}
 
 
 def main():
@@ -21,11 +48,21 @@ def main():
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes for condensing XML parts (default: 1)",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            workers=args.jobs,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +79,18 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, workers=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    Parts are added in sorted path order, so the archive layout doesn't
+    depend on the file system or on the number of workers.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        workers: Number of processes for condensing XML parts
+            (None or 1 = condense in this process)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,34 +103,54 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    files = sorted(f for f in input_dir.rglob("*") if f.is_file())
+    xml_files = [f for f in files if f.name.endswith((".xml", ".rels"))]
+
+    # Write parts straight into the archive: XML is condensed in memory and
+    # other files are streamed from disk, so the input is read only once
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.ExitStack() as stack:
+        if workers and workers > 1 and len(xml_files) > 1:
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+            )
+            chunksize = max(1, len(xml_files) // (workers * 4))
+            condensed = executor.map(condense_xml_file, xml_files, chunksize=chunksize)
+        else:
+            condensed = map(condense_xml_file, xml_files)
+
+        zf = stack.enter_context(
+            zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED)
+        )
+        for f in files:
+            arcname = f.relative_to(input_dir).as_posix()
+            if f.name.endswith((".xml", ".rels")):
+                # Remove pretty-printing whitespace (results arrive in xml_files order)
+                info = zipfile.ZipInfo.from_file(f, arcname)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                zf.writestr(info, next(condensed))
+            elif f.suffix.lower() in STORED_EXTENSIONS:
+                zf.write(f, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(f, arcname)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
 def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+    """Validate document by converting to HTML with soffice.
+
+    Conversions run in a persistent LibreOffice worker when the UNO bindings
+    are available (see soffice.py), so only the first validation in a
+    process pays the soffice startup cost. Successful results are cached by content,
+    so validating an unchanged document again doesn't run LibreOffice at all.
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -100,29 +162,12 @@ def validate_document(doc_path):
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
-            result = subprocess.run(
-                [
-                    "soffice",
-                    "--headless",
-                    "--convert-to",
-                    filter_name,
-                    "--outdir",
-                    temp_dir,
-                    str(doc_path),
-                ],
-                capture_output=True,
-                timeout=10,
-                text=True,
-            )
-            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
-                error_msg = result.stderr.strip() or "Document validation failed"
-                print(f"Validation error: {error_msg}", file=sys.stderr)
-                return False
+            soffice.convert(doc_path, temp_dir, filter_name, timeout=10)
             return True
         except FileNotFoundError:
             print("Warning: soffice not found. Skipping validation.", file=sys.stderr)
             return True
-        except subprocess.TimeoutExpired:
+        except TimeoutError:
             print("Validation error: Timeout during conversion", file=sys.stderr)
             return False
         except Exception as e:
@@ -132,8 +177,45 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+    xml_file = Path(xml_file)
+    xml_file.write_bytes(condense_xml_file(xml_file))
+
+
+def condense_xml_file(xml_file):
+    """Return the condensed content of an XML file."""
+    return condense_xml_bytes(Path(xml_file).read_bytes())
+
+
+def condense_xml_bytes(content):
+    """Return XML content with unnecessary whitespace and comments removed.
+
+    Whitespace-only text and comments are dropped from every element except
+    w:t (any element whose name ends in ":t"). The output is byte-identical
+    to serializing the cleaned minidom tree with toxml(encoding="UTF-8").
+    """
+    try:
+        return _XmlFormatter(condense=True).format(content, "UTF-8")
+    except _MinidomFallback:
+        return _condense_xml_minidom(content)
+
+
+def pretty_xml_bytes(content):
+    """Return XML content pretty-printed with two-space indentation.
+
+    The output is byte-identical to minidom's toprettyxml(indent="  ",
+    encoding="ascii").
+    """
+    try:
+        return _XmlFormatter(indent="  ", newl="\n").format(content, "ascii")
+    except _MinidomFallback:
+        return defusedxml.minidom.parseString(content).toprettyxml(
+            indent="  ", encoding="ascii"
+        )
+
+
+def _condense_xml_minidom(content):
+    """minidom implementation of condense_xml_bytes, used for parts with a DOCTYPE."""
+    dom = defusedxml.minidom.parseString(content)
 
     # Process each element to remove whitespace and comments
     for element in dom.getElementsByTagName("*"):
@@ -150,9 +232,217 @@ def condense_xml(xml_file):
             ) or child.nodeType == child.COMMENT_NODE:
                 element.removeChild(child)
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    return dom.toxml(encoding="UTF-8")
+
+
+class _MinidomFallback(Exception):
+    """Raised by _XmlFormatter for input it doesn't handle (DOCTYPE declarations)."""
+
+
+def _escape(data):
+    """Escape text and attribute values the way minidom does."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+class _XmlFormatter:
+    """Streaming XML re-serializer that reproduces minidom's output.
+
+    The document is parsed with expat (the parser minidom uses, with the
+    same options and the same defusedxml restrictions) and written out as
+    parse events arrive, without building a DOM. Consecutive character data
+    is merged into one text node as in minidom; the only state kept per
+    open element is whether its children have to be written on separate
+    lines.
+    """
+
+    # Per-element layout state: no children yet, a single text/CDATA child
+    # held back (written inline if it stays the only child), or children
+    # written on their own lines
+    _EMPTY, _HELD, _BLOCK = range(3)
+
+    def __init__(self, indent="", newl="", condense=False):
+        self.indent = indent
+        self.newl = newl
+        self.condense = condense
+
+    def format(self, content, encoding):
+        """Parse content (str or bytes) and return it re-serialized as bytes."""
+        self._out = []
+        self._stack = []  # [qname, indent, state, held node] per open element
+        self._text = []  # Character data not yet flushed as a text node
+        self._cdata = None  # Data of the CDATA section being parsed
+        self._ns_decls = []  # Namespace declarations for the next element
+
+        parser = expat.ParserCreate(namespace_separator=" ")
+        parser.namespace_prefixes = True
+        parser.buffer_text = True
+        parser.ordered_attributes = True
+        parser.specified_attributes = True
+        parser.StartDoctypeDeclHandler = self._doctype
+        parser.StartNamespaceDeclHandler = self._namespace
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
+        parser.CharacterDataHandler = self._data
+        parser.StartCdataSectionHandler = self._start_cdata
+        parser.EndCdataSectionHandler = self._end_cdata
+        parser.CommentHandler = self._comment
+        parser.ProcessingInstructionHandler = self._pi
+        parser.EntityDeclHandler = self._entity_decl
+        parser.UnparsedEntityDeclHandler = self._unparsed_entity_decl
+        parser.ExternalEntityRefHandler = self._external_entity_ref
+
+        self._out.append(f'<?xml version="1.0" encoding="{encoding}"?>{self.newl}')
+        parser.Parse(content, True)
+        self._flush_text()
+        return "".join(self._out).encode(encoding, "xmlcharrefreplace")
+
+    # Parser callbacks
+
+    def _doctype(self, name, sysid, pubid, has_internal_subset):
+        raise _MinidomFallback()
+
+    def _entity_decl(self, name, is_parameter, value, base, sysid, pubid, notation):
+        raise EntitiesForbidden(name, value, base, sysid, pubid, notation)
+
+    def _unparsed_entity_decl(self, name, base, sysid, pubid, notation):
+        raise EntitiesForbidden(name, None, base, sysid, pubid, notation)
+
+    def _external_entity_ref(self, context, base, sysid, pubid):
+        raise ExternalReferenceForbidden(context, base, sysid, pubid)
+
+    def _namespace(self, prefix, uri):
+        self._ns_decls.append(("xmlns:" + prefix if prefix else "xmlns", uri or ""))
+
+    def _start(self, name, attributes):
+        self._flush_text()
+        indent = self._child_indent()
+        self._open_child()
+
+        parts = [indent, "<", _qname(name)]
+        for attr_name, value in self._ns_decls:
+            parts += [" ", attr_name, '="', _escape(value), '"']
+        self._ns_decls.clear()
+        for i in range(0, len(attributes), 2):
+            parts += [" ", _qname(attributes[i]), '="', _escape(attributes[i + 1]), '"']
+        self._out.append("".join(parts))
+        self._stack.append([_qname(name), indent, self._EMPTY, None])
+
+    def _end(self, name):
+        self._flush_text()
+        qname, indent, state, held = self._stack.pop()
+        if state == self._EMPTY:
+            self._out.append("/>" + self.newl)
+        elif state == self._HELD:
+            self._out.append(">" + self._inline(held) + f"</{qname}>{self.newl}")
+        else:
+            self._out.append(f"{indent}</{qname}>{self.newl}")
+
+    def _data(self, data):
+        if self._cdata is None:
+            self._text.append(data)
+            return
+        if not self._cdata:
+            # Text before a non-empty CDATA section ends there
+            self._flush_text()
+        self._cdata.append(data)
+
+    def _start_cdata(self):
+        self._cdata = []
+
+    def _end_cdata(self):
+        data = "".join(self._cdata)
+        self._cdata = None
+        # An empty CDATA section creates no node
+        if data:
+            self._add_leaf(("cdata", data))
+
+    def _comment(self, data):
+        self._flush_text()
+        if self.condense and self._stack and not self._in_text_element():
+            return
+        self._add_leaf(("comment", data))
+
+    def _pi(self, target, data):
+        self._flush_text()
+        self._add_leaf(("pi", target, data))
+
+    # Output
+
+    def _flush_text(self):
+        if not self._text:
+            return
+        data = "".join(self._text)
+        self._text.clear()
+        if self.condense and not data.strip() and not self._in_text_element():
+            return
+        self._add_leaf(("text", data))
+
+    def _in_text_element(self):
+        """Return True inside a w:t-like element, whose content is kept as is."""
+        return self._stack[-1][0].endswith(":t")
+
+    def _child_indent(self):
+        if not self._stack:
+            return ""
+        return self._stack[-1][1] + self.indent
+
+    def _open_child(self, node=None):
+        """Update the parent's layout for a new child.
+
+        Returns True if the child (a leaf node) is held back by the parent.
+        """
+        if not self._stack:
+            return False
+        frame = self._stack[-1]
+        if (
+            frame[2] == self._EMPTY
+            and node is not None
+            and node[0] in ("text", "cdata")
+        ):
+            frame[2], frame[3] = self._HELD, node
+            return True
+        if frame[2] != self._BLOCK:
+            self._out.append(">" + self.newl)
+            if frame[2] == self._HELD:
+                self._out.append(self._block(frame[3], frame[1] + self.indent))
+            frame[2], frame[3] = self._BLOCK, None
+        return False
+
+    def _add_leaf(self, node):
+        if not self._open_child(node):
+            self._out.append(self._block(node, self._child_indent()))
+
+    def _inline(self, node):
+        """Serialize the only child of an element, which is text or CDATA."""
+        if node[0] == "text":
+            return _escape(node[1])
+        return f"<![CDATA[{node[1]}]]>"
+
+    def _block(self, node, indent):
+        """Serialize a leaf node on its own line."""
+        kind = node[0]
+        if kind == "text":
+            return _escape(indent + node[1] + self.newl)
+        if kind == "cdata":
+            return f"<![CDATA[{node[1]}]]>"
+        if kind == "comment":
+            return f"{indent}<!--{node[1]}-->{self.newl}"
+        return f"{indent}<?{node[1]} {node[2]}?>{self.newl}"
+
+
+def _qname(name):
+    """Turn an expat "uri local [prefix]" name into the prefixed name from the source."""
+    if " " not in name:
+        return name
+    parts = name.split(" ")
+    if len(parts) == 3:
+        return f"{parts[2]}:{parts[1]}"
+    return parts[1]
 
 
 if __name__ == "__main__":
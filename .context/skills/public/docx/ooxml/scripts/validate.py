@@ -3,14 +3,21 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N] [--streaming] [--json]
 """
 
 import argparse
+import contextlib
+import json
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
 
 
 def main():
@@ -30,6 +37,23 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes for XSD validation (default: 1)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream very large parts instead of loading them whole (lower memory use)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Write structured results as JSON to stdout (messages go to stderr)",
+    )
     args = parser.parse_args()
 
     # Validate paths
@@ -54,16 +78,49 @@ def main():
 
     # Run validators
     success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    results = []
+    # In JSON mode stdout carries only the JSON document
+    output = sys.stderr if args.json else sys.stdout
+    schema_validator = None
+    with contextlib.redirect_stdout(output):
+        for V in validators:
+            if issubclass(V, BaseSchemaValidator):
+                validator = V(
+                    unpacked_dir,
+                    original_file,
+                    verbose=args.verbose,
+                    workers=args.jobs,
+                    streaming=args.streaming,
+                )
+                schema_validator = validator
+            else:
+                validator = V(
+                    unpacked_dir,
+                    original_file,
+                    verbose=args.verbose,
+                    schema_validator=schema_validator,
+                )
+            if not validator.validate():
+                success = False
+            results.append(validator.result.to_dict())
 
-    if success:
-        print("All validations PASSED!")
+        if success:
+            print("All validations PASSED!")
 
-    sys.exit(0 if success else 1)
+    if args.json:
+        json.dump(
+            {
+                "unpacked_dir": str(unpacked_dir),
+                "original": str(original_file),
+                "passed": success,
+                "validators": results,
+            },
+            sys.stdout,
+            indent=2,
+        )
+        print()
 
+    sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     main()
@@ -6,10 +6,17 @@ from .base import BaseSchemaValidator
 from .docx import DOCXSchemaValidator
 from .pptx import PPTXSchemaValidator
 from .redlining import RedliningValidator
+from .results import CheckResult, ValidationError, ValidationResult
+from .rules import RuleEngine, ValidationRule
 
 __all__ = [
     "BaseSchemaValidator",
+    "CheckResult",
     "DOCXSchemaValidator",
     "PPTXSchemaValidator",
     "RedliningValidator",
+    "RuleEngine",
+    "ValidationError",
+    "ValidationResult",
+    "ValidationRule",
 ]
@@ -2,117 +2,184 @@
 Validator for tracked changes in Word documents.
 """
 
-import subprocess
-import tempfile
+import difflib
+import hashlib
+import re
+import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
 
+import lxml.etree
+
+from .results import ValidationError, ValidationResult, validation_check
+
+# Words, single whitespace characters and single punctuation characters
+_TOKEN_PATTERN = re.compile(r"\w+|\s|[^\w\s]")
+
+# Changed token runs up to this many characters (both sides together) are
+# diffed again character by character, like `git diff --word-diff-regex=.`
+_CHAR_DIFF_LIMIT = 200
+
+# Markers pushed on the traversal stack of _extract_accepted_text
+_END_PARAGRAPH = object()
+_END_DELETION = object()
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_docx, verbose=False, schema_validator=None
+    ):
         self.unpacked_dir = Path(unpacked_dir)
         self.original_docx = Path(original_docx)
         self.verbose = verbose
+        # Schema validator for the same document, whose parsed trees and
+        # original package contents are reused instead of parsing again
+        self.schema_validator = schema_validator
         self.namespaces = {
             "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
         }
+        # Structured record of the last validate() call
+        self.result = ValidationResult(type(self).__name__)
+        # (SHA-256 of document.xml, (size, mtime_ns) of the original docx) of
+        # the last validation that passed, so that re-validating an unchanged
+        # document against an unchanged original is free
+        self._passed_digest = None
+        # ((size, mtime_ns) of the original docx, its text without Claude's changes)
+        self._original_text = None
 
     def validate(self):
-        """Main validation method that returns True if valid, False otherwise."""
+        """Main validation method that returns True if valid, False otherwise.
+
+        Details are recorded in self.result.
+        """
+        self.result = ValidationResult(type(self).__name__)
+        return self.validate_tracked_changes()
+
+    @validation_check("tracked_changes")
+    def validate_tracked_changes(self):
+        """Validate that all changes by Claude are marked as tracked changes."""
         # Verify unpacked directory exists and has correct structure
         modified_file = self.unpacked_dir / "word" / "document.xml"
         if not modified_file.exists():
+            self._add_error("missing_part", "Modified document.xml not found")
             print(f"FAILED - Modified document.xml not found at {modified_file}")
             return False
 
-        # First, check if there are any tracked changes by Claude to validate
+        digest = (
+            hashlib.sha256(modified_file.read_bytes()).hexdigest(),
+            self._original_key(),
+        )
+        if digest == self._passed_digest:
+            if self.verbose:
+                print("PASSED - document.xml unchanged since last validation")
+            return True
+
+        # Parse the modified document and take its text with Claude's changes
+        # removed, noting whether there are any
         try:
-            import xml.etree.ElementTree as ET
-
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
-
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
-
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
-
-        except Exception:
-            # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
-                )
-                return False
-
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
-            try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+            modified_root = self._parse_modified(modified_file)
+        except (ET.ParseError, lxml.etree.XMLSyntaxError) as e:
+            self._add_error("part_error", f"Error parsing XML files: {e}")
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        modified_text, claude_changes = self._extract_accepted_text(modified_root)
 
+        # Redlining validation is only needed if tracked changes by Claude have been used.
+        if not claude_changes:
             if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
+                print("PASSED - No tracked changes by Claude found.")
+            self._passed_digest = digest
             return True
 
+        # Text of the original document, read straight from the package
+        try:
+            original_text = self._get_original_text()
+        except KeyError:
+            self._add_error(
+                "missing_part", "Original document.xml not found", file=None
+            )
+            print(f"FAILED - Original document.xml not found in {self.original_docx}")
+            return False
+        except (ET.ParseError, lxml.etree.XMLSyntaxError) as e:
+            self._add_error("part_error", f"Error parsing XML files: {e}", file=None)
+            print(f"FAILED - Error parsing XML files: {e}")
+            return False
+        except Exception as e:
+            self._add_error(
+                "part_error", f"Error unpacking original docx: {e}", file=None
+            )
+            print(f"FAILED - Error unpacking original docx: {e}")
+            return False
+
+        if modified_text != original_text:
+            # Show detailed character-level differences for each paragraph
+            error_message = self._generate_detailed_diff(original_text, modified_text)
+            self._add_error(
+                "untracked_changes", error_message.removeprefix("FAILED - ")
+            )
+            print(error_message)
+            return False
+
+        if self.verbose:
+            print("PASSED - All changes by Claude are properly tracked")
+        self._passed_digest = digest
+        return True
+
+    def _get_original_text(self):
+        """Return the text of the original document.xml without Claude's tracked changes.
+
+        The text is cached until the original docx changes on disk.
+
+        Raises:
+            KeyError: If the package has no word/document.xml
+            ET.ParseError: If word/document.xml is not well-formed
+        """
+        key = self._original_key()
+        if key is None or self._original_text is None or self._original_text[0] != key:
+            content = None
+            if self._shares_original():
+                content = self.schema_validator._read_original_part("word/document.xml")
+            if content is None:
+                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
+                    content = zip_ref.read("word/document.xml")
+            original_text, _ = self._extract_accepted_text(ET.fromstring(content))
+            self._original_text = (key, original_text)
+        return self._original_text[1]
+
+    def _original_key(self):
+        """Return (size, mtime_ns) of the original docx, or None if it is missing."""
+        try:
+            stat = self.original_docx.stat()
+        except OSError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _parse_modified(self, modified_file):
+        """Return the root element of the modified document.xml.
+
+        Uses the schema validator's cached lxml tree when there is one; the
+        tree is shared and only read here.
+        """
+        if self.schema_validator is not None:
+            return self.schema_validator._parse_xml(modified_file).getroot()
+        return ET.parse(modified_file).getroot()
+
+    def _shares_original(self):
+        """Return True if the schema validator reads the same original package."""
+        original_file = getattr(self.schema_validator, "original_file", None)
+        return (
+            original_file is not None
+            and original_file.resolve() == self.original_docx.resolve()
+        )
+
+    def _add_error(self, rule, message, file="word/document.xml"):
+        """Record a failure of the tracked changes check in self.result."""
+        self.result.add_errors([ValidationError(rule, message, file=file)])
+
     def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
+        """Generate detailed word-level differences between the document texts."""
         error_parts = [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
@@ -127,152 +194,167 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
+        # Show word diff
+        word_diff = self._get_word_diff(original_text, modified_text)
+        if word_diff:
+            error_parts.extend(["Differences:", "============", word_diff])
         else:
-            error_parts.append("Unable to generate word diff (git not available)")
+            error_parts.append("Unable to generate word diff")
 
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
-
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+    def _get_word_diff(self, original_text, modified_text):
+        """Generate a word diff in the format of `git diff --word-diff=plain -U0`.
 
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
-
-        return None
-
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
+        Paragraphs are aligned first, so unchanged paragraphs cost one string
+        comparison each. Each run of changed paragraphs is then diffed word by
+        word, and short changed runs character by character. Deletions are
+        shown as [-text-] and insertions as {+text+}; only changed lines are
+        included.
         """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+        original_lines = original_text.split("\n")
+        modified_lines = modified_text.split("\n")
+        matcher = difflib.SequenceMatcher(
+            None, original_lines, modified_lines, autojunk=False
+        )
+
+        output = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            segments = _diff_segments(
+                "\n".join(original_lines[i1:i2]), "\n".join(modified_lines[j1:j2])
+            )
+            output.extend(
+                line for line in _render_segments(segments).split("\n") if line.strip()
+            )
+        return "\n".join(output) or None
+
+    def _extract_accepted_text(self, root):
+        """Extract the text of a document as if Claude's tracked changes were rejected.
+
+        Walks the tree once without modifying it (so shared parsed trees can
+        be used): w:ins elements by Claude are skipped with their content,
+        and text inside w:del elements by Claude (w:delText) counts as
+        regular text. Each paragraph's text is that of all w:t elements it
+        contains, nested paragraphs included. Empty paragraphs are skipped to
+        avoid false positives when tracked insertions add only structural
+        elements without text content.
+
+        Works with both xml.etree.ElementTree and lxml elements.
+
+        Returns:
+            tuple: (paragraph texts joined by newlines, number of w:ins and
+                w:del elements by Claude found)
+        """
+        w = self.namespaces["w"]
+        p_tag = f"{{{w}}}p"
+        t_tag = f"{{{w}}}t"
+        deltext_tag = f"{{{w}}}delText"
+        ins_tag = f"{{{w}}}ins"
+        del_tag = f"{{{w}}}del"
+        author_attr = f"{{{w}}}author"
+
+        paragraphs = []  # Text parts of each paragraph, in document order
+        open_paragraphs = []  # Text parts of the paragraphs enclosing elem
+        claude_deletions = 0  # Number of Claude's w:del elements enclosing elem
+        claude_changes = 0
+
+        stack = [root]
+        while stack:
+            elem = stack.pop()
+            if elem is _END_PARAGRAPH:
+                open_paragraphs.pop()
+                continue
+            if elem is _END_DELETION:
+                claude_deletions -= 1
+                continue
+
+            tag = elem.tag
+            if tag == t_tag or (tag == deltext_tag and claude_deletions):
+                if elem.text:
+                    for parts in open_paragraphs:
+                        parts.append(elem.text)
+            elif tag == p_tag:
+                parts = []
+                paragraphs.append(parts)
+                open_paragraphs.append(parts)
+                stack.append(_END_PARAGRAPH)
+            elif tag == ins_tag and elem.get(author_attr) == "Claude":
+                claude_changes += 1
+                continue
+            elif tag == del_tag and elem.get(author_attr) == "Claude":
+                claude_changes += 1
+                claude_deletions += 1
+                stack.append(_END_DELETION)
+            stack.extend(reversed(elem))
+
+        text = "\n".join(filter(None, ("".join(parts) for parts in paragraphs)))
+        return text, claude_changes
+
+
+def _diff_segments(original, modified):
+    """Return the differences between two texts as (op, text) pairs.
+
+    op is "=" for unchanged text, "-" for deleted and "+" for inserted text.
+    """
+    original_tokens = _TOKEN_PATTERN.findall(original)
+    modified_tokens = _TOKEN_PATTERN.findall(modified)
+    matcher = difflib.SequenceMatcher(
+        None, original_tokens, modified_tokens, autojunk=False
+    )
+
+    segments = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        old = "".join(original_tokens[i1:i2])
+        new = "".join(modified_tokens[j1:j2])
+        if tag == "equal":
+            segments.append(("=", old))
+        elif tag == "replace" and len(old) + len(new) <= _CHAR_DIFF_LIMIT:
+            char_matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+            for char_tag, k1, k2, l1, l2 in char_matcher.get_opcodes():
+                if char_tag == "equal":
+                    segments.append(("=", old[k1:k2]))
+                    continue
+                if k1 < k2:
+                    segments.append(("-", old[k1:k2]))
+                if l1 < l2:
+                    segments.append(("+", new[l1:l2]))
+        else:
+            if old:
+                segments.append(("-", old))
+            if new:
+                segments.append(("+", new))
+
+    # Merge neighbouring segments of the same kind
+    merged = []
+    for op, text in segments:
+        if merged and merged[-1][0] == op:
+            merged[-1] = (op, merged[-1][1] + text)
+        else:
+            merged.append((op, text))
+    return merged
+
+
+def _render_segments(segments):
+    """Render diff segments with git's [-deleted-] and {+inserted+} markers.
+
+    Deleted line breaks are dropped and inserted ones start a new line, as
+    git does.
+    """
+    parts = []
+    for op, text in segments:
+        if op == "=":
+            parts.append(text)
+        elif op == "-":
+            parts.extend(f"[-{piece}-]" for piece in text.split("\n") if piece)
+        else:
+            parts.append(
+                "\n".join(
+                    f"{{+{piece}+}}" if piece else "" for piece in text.split("\n")
+                )
+            )
+    return "".join(parts)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,552 @@
+"""
+Single-pass rule engine for structural checks on OOXML parts.
+
+Each ValidationRule registers handlers for element start/end events and for
+attributes. RuleEngine walks every part once and dispatches each element to
+all interested rules, so adding a check does not add another traversal.
+Large parts can be streamed with iterparse instead of being loaded whole.
+"""
+
+import itertools
+from pathlib import Path
+
+import lxml.etree
+
+from .results import ValidationError
+
+# Lowercase local names of Clark-notation tags and attribute names, e.g.
+# "{http://...}sldId" -> "sldid". OOXML uses a small, fixed vocabulary, so
+# this stays small and is shared by all rules in the process.
+_LOCAL_NAMES = {}
+
+
+def local_name(name):
+    """Return the lowercase local part of a Clark-notation tag or attribute name."""
+    local = _LOCAL_NAMES.get(name)
+    if local is None:
+        local = name.rsplit("}", 1)[-1].lower()
+        _LOCAL_NAMES[name] = local
+    return local
+
+
+def iterparse_events(source):
+    """Yield ("start", elem) and ("end", elem) events for a part while parsing it.
+
+    source is a filename or a binary file object.
+    Unlike raw iterparse, a start event is only yielded once the element's
+    text has been parsed (when its first child starts, or when it ends), so
+    handlers can read elem.text and attributes as in a full tree. After its
+    end event each element is cleared and removed from its parent, so memory
+    use doesn't grow with the size of the part. Comments are skipped.
+
+    Raises:
+        lxml.etree.XMLSyntaxError: When a not well-formed part of the file is
+            reached (events before that point have already been yielded)
+    """
+    pending = None
+    for event, elem in lxml.etree.iterparse(source, events=("start", "end")):
+        if pending is not None:
+            yield "start", pending
+            pending = None
+
+        if event == "start":
+            pending = elem
+            continue
+
+        yield "end", elem
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        if parent is not None:
+            # Drop this element and anything before it in the parent
+            while elem.getprevious() is not None:
+                del parent[0]
+            parent.remove(elem)
+
+
+class Part:
+    """An XML part being checked by the rule engine."""
+
+    def __init__(self, path, relative_path):
+        self.path = path  # Absolute path of the part
+        self.relative_path = relative_path  # Path relative to the unpacked dir
+        self.root = None  # Root element, set once the part is parsed
+        self.depth = 0  # Depth of the element being visited (root = 1)
+
+
+class ValidationRule:
+    """Base class for checks run by RuleEngine.
+
+    Subclasses register their handlers in register() and record
+    ValidationErrors in self.errors with report(). Handlers for a part are
+    only called if applies_to(part) is True; start_part() runs before the
+    traversal of each part and end_part() after it. If parsing the part or any handler raises, part_error() is
+    called and the rule is skipped for the rest of that part.
+
+    The engine also files each error under the part being checked when it was
+    reported (errors_by_part), which lets validators re-check only changed
+    parts. A rule whose results for one part depend on the content of other
+    parts adds those parts to cross_part_files.
+    """
+
+    def __init__(self, validator):
+        self.validator = validator
+        self.errors = []
+        self.errors_by_part = {}  # Part path -> errors reported while checking it
+        self.cross_part_files = set()  # Parts that affect other parts' results
+
+    def register(self, registry):
+        """Register handlers with a RuleRegistry."""
+
+    def applies_to(self, part):
+        """Return True if this rule should check the given part."""
+        return True
+
+    def start_part(self, part):
+        """Called before the elements of a part are visited."""
+
+    def end_part(self, part):
+        """Called after all elements of a part have been visited."""
+
+    def report(self, rule, file, message, line=None):
+        """Record a violation of rule in file (a path relative to the unpacked dir)."""
+        self.errors.append(
+            ValidationError(rule, message, file=Path(file).as_posix(), line=line)
+        )
+
+    def part_error(self, part, error):
+        """Called when a part can't be parsed or a handler raised."""
+        self.report("part_error", part.relative_path, f"Error: {error}")
+
+    def finish(self):
+        """Called once after all parts have been checked."""
+
+
+class RuleRegistry:
+    """Collects the handlers registered by one rule."""
+
+    def __init__(self):
+        self.start = []  # (tag or None, handler(elem))
+        self.end = []  # (tag or None, handler(elem))
+        self.attributes = []  # (attribute name or None, handler(elem, name, value))
+        self.needs_depth = False
+
+    def on_start(self, tag, handler):
+        """Call handler(elem) when an element with this tag starts (None = any tag)."""
+        self.start.append((tag, handler))
+
+    def on_end(self, tag, handler):
+        """Call handler(elem) when an element with this tag ends (None = any tag)."""
+        self.end.append((tag, handler))
+
+    def on_attribute(self, name, handler):
+        """Call handler(elem, name, value) for this attribute (None = any attribute)."""
+        self.attributes.append((name, handler))
+
+    def track_depth(self):
+        """Ask the engine to keep part.depth up to date while walking."""
+        self.needs_depth = True
+
+
+class _HandlerIndex(dict):
+    """Maps a tag or attribute name to its (rule, handler) pairs.
+
+    Looking up a key returns the catch-all handlers followed by the handlers
+    registered for that key; the merged list is built once per key.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.any = []
+        self.by_key = {}
+
+    def add(self, key, rule, handler):
+        if key is None:
+            self.any.append((rule, handler))
+        else:
+            self.by_key.setdefault(key, []).append((rule, handler))
+
+    def __missing__(self, key):
+        handlers = self.any + self.by_key.get(key, [])
+        self[key] = handlers
+        return handlers
+
+    def __bool__(self):
+        return bool(self.any or self.by_key)
+
+
+class _DispatchTable:
+    """Handlers of a set of rules, indexed by tag and attribute name."""
+
+    def __init__(self, rules, registries):
+        self.start = _HandlerIndex()
+        self.end = _HandlerIndex()
+        self.attributes = _HandlerIndex()
+        self.track_depth = False
+
+        for rule in rules:
+            registry = registries[rule]
+            for tag, handler in registry.start:
+                self.start.add(tag, rule, handler)
+            for tag, handler in registry.end:
+                self.end.add(tag, rule, handler)
+            for name, handler in registry.attributes:
+                self.attributes.add(name, rule, handler)
+            self.track_depth = self.track_depth or registry.needs_depth
+
+        self.attribute_names = list(self.attributes.by_key)
+        self.has_end = bool(self.end) or self.track_depth
+        self.has_attributes = bool(self.attributes)
+        self.is_empty = not (self.start or self.has_end or self.has_attributes)
+
+
+class RuleEngine:
+    """Runs ValidationRules over XML parts with one traversal per part."""
+
+    def __init__(self, rules):
+        self.rules = list(rules)
+        self._registries = {}
+        for rule in self.rules:
+            registry = RuleRegistry()
+            rule.register(registry)
+            self._registries[rule] = registry
+
+    def run(self, xml_files, base_dir, parse, stream=None):
+        """Check all XML files and return the rules (with their errors).
+
+        Args:
+            xml_files: Paths of the parts to check, in reporting order
+            base_dir: Directory that relative paths in messages are based on
+            parse: Callable returning the lxml ElementTree for a path
+            stream: Optional predicate; parts it returns True for are read
+                with iterparse_events instead of parse
+        """
+        for xml_file in xml_files:
+            part = Part(xml_file, xml_file.relative_to(base_dir))
+            error_counts = [len(rule.errors) for rule in self.rules]
+            if stream is not None and stream(xml_file):
+                self._stream_file(part, error_counts)
+            else:
+                self._check_file(part, parse)
+            for rule, count in zip(self.rules, error_counts):
+                rule.errors_by_part[xml_file] = rule.errors[count:]
+
+        for rule in self.rules:
+            rule.finish()
+        return self.rules
+
+    def _check_file(self, part, parse):
+        """Parse a part and check it with every rule that applies to it."""
+        rules = [rule for rule in self.rules if rule.applies_to(part)]
+        if not rules:
+            return
+
+        try:
+            part.root = parse(part.path).getroot()
+        except Exception as e:
+            for rule in rules:
+                rule.part_error(part, e)
+            return
+
+        self._check_part(part, rules)
+
+    def _stream_file(self, part, error_counts):
+        """Check a part while parsing it, without keeping the whole tree.
+
+        Reports the same errors as _check_file: if the part turns out not to
+        be well-formed, errors already reported for it are discarded and
+        part_error() is called instead.
+        """
+        rules = [rule for rule in self.rules if rule.applies_to(part)]
+        if not rules:
+            return
+
+        try:
+            events = iterparse_events(str(part.path))
+            first = next(events)
+            part.root = first[1]
+            self._check_part(part, rules, itertools.chain([first], events))
+        except lxml.etree.XMLSyntaxError as e:
+            for rule, count in zip(self.rules, error_counts):
+                if rule in rules:
+                    del rule.errors[count:]
+                    rule.part_error(part, e)
+
+    def _check_part(self, part, rules, events=None):
+        """Visit every element of a part once, dispatching to all active rules.
+
+        Walks part.root unless events (see iterparse_events) are given, in
+        which case all of them are consumed.
+        """
+        active = []
+        for rule in rules:
+            try:
+                rule.start_part(part)
+            except Exception as e:
+                rule.part_error(part, e)
+            else:
+                active.append(rule)
+
+        table = _DispatchTable(active, self._registries)
+        if events is None and not table.is_empty:
+            if table.has_end:
+                events = lxml.etree.iterwalk(part.root, events=("start", "end"))
+            else:
+                events = (("start", e) for e in part.root.iter(lxml.etree.Element))
+
+        if events is not None:
+            for event, elem in events:
+                failed = None
+
+                if event == "start":
+                    part.depth += 1
+                    for rule, handler in table.start[elem.tag]:
+                        try:
+                            handler(elem)
+                        except Exception as e:
+                            failed = (failed or []) + [(rule, e)]
+
+                    if table.attributes.any:
+                        # Catch-all attribute handlers need every attribute
+                        attributes = elem.items()
+                    else:
+                        # Only look up the attribute names that have handlers
+                        attributes = []
+                        for name in table.attribute_names:
+                            value = elem.get(name)
+                            if value is not None:
+                                attributes.append((name, value))
+                    for name, value in attributes:
+                        for rule, handler in table.attributes[name]:
+                            try:
+                                handler(elem, name, value)
+                            except Exception as e:
+                                failed = (failed or []) + [(rule, e)]
+                else:
+                    for rule, handler in table.end[elem.tag]:
+                        try:
+                            handler(elem)
+                        except Exception as e:
+                            failed = (failed or []) + [(rule, e)]
+                    part.depth -= 1
+
+                if failed:
+                    # Drop failing rules for the rest of this part
+                    for rule, error in failed:
+                        if rule in active:
+                            active.remove(rule)
+                            rule.part_error(part, error)
+                    table = _DispatchTable(active, self._registries)
+
+        for rule in active:
+            rule.end_part(part)
+
+
+class NamespaceRule(ValidationRule):
+    """Namespace prefixes in mc:Ignorable attributes must be declared."""
+
+    def start_part(self, part):
+        root = part.root
+        declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+        for attr_val in [v for k, v in root.attrib.items() if k.endswith("Ignorable")]:
+            undeclared = set(attr_val.split()) - declared
+            for ns in undeclared:
+                self.report(
+                    "undeclared_ignorable_namespace",
+                    part.relative_path,
+                    f"Namespace '{ns}' in Ignorable but not declared",
+                )
+
+    def part_error(self, part, error):
+        # Unparseable files are reported by validate_xml
+        pass
+
+
+class UniqueIdRule(ValidationRule):
+    """IDs listed in UNIQUE_ID_REQUIREMENTS must be unique per file or globally.
+
+    Elements inside mc:AlternateContent are ignored, as are elements inside
+    EXCLUDED_ID_CONTAINERS. Both are tracked while walking (a nesting counter
+    and the depth of the open excluded container), so the check is linear in
+    the number of elements. Parts containing globally scoped IDs are recorded
+    in cross_part_files.
+    """
+
+    def __init__(self, validator):
+        super().__init__(validator)
+        self.requirements = validator.UNIQUE_ID_REQUIREMENTS
+        self.excluded_containers = validator.EXCLUDED_ID_CONTAINERS
+        self.global_ids = {}  # Track globally unique IDs across all files
+        self.file_ids = {}  # Track IDs that must be unique within the current file
+        self.alternate_content_depth = 0
+        self.excluded_container_depth = None  # Depth of the open excluded container
+
+    def register(self, registry):
+        alternate_content = f"{{{self.validator.MC_NAMESPACE}}}AlternateContent"
+        registry.on_start(alternate_content, self._enter_alternate_content)
+        registry.on_end(alternate_content, self._leave_alternate_content)
+        registry.on_start(None, self._check_element)
+        registry.track_depth()
+
+    def start_part(self, part):
+        self.part = part
+        self.file_ids = {}
+        self.alternate_content_depth = 0
+        self.excluded_container_depth = None
+
+    def _enter_alternate_content(self, elem):
+        self.alternate_content_depth += 1
+
+    def _leave_alternate_content(self, elem):
+        self.alternate_content_depth -= 1
+
+    def _check_element(self, elem):
+        # Get the element name without namespace
+        tag = _LOCAL_NAMES.get(elem.tag) or local_name(elem.tag)
+        depth = self.part.depth
+
+        # An element at or above the excluded container's depth is outside it
+        excluded_depth = self.excluded_container_depth
+        if excluded_depth is not None and depth <= excluded_depth:
+            self.excluded_container_depth = excluded_depth = None
+
+        # Skip elements inside mc:AlternateContent or an excluded container
+        # (e.g., <p14:sldId> inside <p14:sectionLst> is a reference, not a definition)
+        if (
+            tag in self.requirements
+            and not self.alternate_content_depth
+            and excluded_depth is None
+        ):
+            self._check_id(elem, tag)
+
+        if excluded_depth is None and tag in self.excluded_containers:
+            self.excluded_container_depth = depth
+
+    def _check_id(self, elem, tag):
+        attr_name, scope = self.requirements[tag]
+
+        # Look for the specified attribute
+        id_value = None
+        for attr, value in elem.items():
+            if (_LOCAL_NAMES.get(attr) or local_name(attr)) == attr_name:
+                id_value = value
+                break
+
+        if id_value is None:
+            return
+
+        relative_path = self.part.relative_path
+        if scope == "global":
+            self.cross_part_files.add(self.part.path)
+            # Check global uniqueness
+            if id_value in self.global_ids:
+                prev_file, prev_line, prev_tag = self.global_ids[id_value]
+                self.report(
+                    "duplicate_global_id",
+                    relative_path,
+                    f"Global ID '{id_value}' in <{tag}> "
+                    f"already used in {prev_file} at line {prev_line} in <{prev_tag}>",
+                    line=elem.sourceline,
+                )
+            else:
+                self.global_ids[id_value] = (relative_path, elem.sourceline, tag)
+        elif scope == "file":
+            # Check file-level uniqueness
+            ids = self.file_ids.setdefault((tag, attr_name), {})
+            if id_value in ids:
+                self.report(
+                    "duplicate_id",
+                    relative_path,
+                    f"Duplicate {attr_name}='{id_value}' in <{tag}> "
+                    f"(first occurrence at line {ids[id_value]})",
+                    line=elem.sourceline,
+                )
+            else:
+                ids[id_value] = elem.sourceline
+
+
+class RelationshipIdRule(ValidationRule):
+    """r:id attributes must reference relationships in the part's .rels file.
+
+    When the validator defines ELEMENT_RELATIONSHIP_TYPES, the relationship
+    type is checked as well.
+    """
+
+    def register(self, registry):
+        registry.on_attribute(
+            f"{{{self.validator.OFFICE_RELATIONSHIPS_NAMESPACE}}}id", self._check_rid
+        )
+
+    @staticmethod
+    def _rels_file(part):
+        # For dir/file.xml, it's dir/_rels/file.xml.rels
+        return part.path.parent / "_rels" / f"{part.path.name}.rels"
+
+    def applies_to(self, part):
+        # Skip .rels files themselves, and files without a .rels file (that's okay)
+        return part.path.suffix != ".rels" and self._rels_file(part).exists()
+
+    def start_part(self, part):
+        self.part = part
+        self.rid_to_type = {}
+
+        # Parse the .rels file to get valid relationship IDs and their types
+        rels_file = self._rels_file(part)
+        rels_root = self.validator._parse_xml(rels_file).getroot()
+        for rel in rels_root.findall(
+            f".//{{{self.validator.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        ):
+            rid = rel.get("Id")
+            rel_type = rel.get("Type", "")
+            if rid:
+                # Check for duplicate rIds
+                if rid in self.rid_to_type:
+                    rels_rel_path = rels_file.relative_to(self.validator.unpacked_dir)
+                    self.report(
+                        "duplicate_relationship_id",
+                        rels_rel_path,
+                        f"Duplicate relationship ID '{rid}' (IDs must be unique)",
+                        line=rel.sourceline,
+                    )
+                # Extract just the type name from the full URL
+                type_name = rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                self.rid_to_type[rid] = type_name
+
+    def _check_rid(self, elem, name, rid_attr):
+        if not rid_attr:
+            return
+
+        rid_to_type = self.rid_to_type
+        xml_rel_path = self.part.relative_path
+        elem_name = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+
+        # Check if the ID exists
+        if rid_attr not in rid_to_type:
+            self.report(
+                "missing_relationship",
+                xml_rel_path,
+                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})",
+                line=elem.sourceline,
+            )
+        # Check if we have type expectations for this element
+        elif self.validator.ELEMENT_RELATIONSHIP_TYPES:
+            expected_type = self.validator._get_expected_relationship_type(elem_name)
+            if expected_type:
+                actual_type = rid_to_type[rid_attr]
+                # Check if the actual type matches or contains the expected type
+                if expected_type not in actual_type.lower():
+                    self.report(
+                        "relationship_type_mismatch",
+                        xml_rel_path,
+                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                        f"but should point to a '{expected_type}' relationship",
+                        line=elem.sourceline,
+                    )
+
+    def part_error(self, part, error):
+        self.report("part_error", part.relative_path, f"Error processing: {error}")
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
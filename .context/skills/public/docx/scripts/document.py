@@ -8,6 +8,7 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', original_docx='input.docx', link_files=True)
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
@@ -22,11 +23,18 @@ Usage:
     doc["word/document.xml"].revert_insertion(ins_node)  # Reject insertion
     doc["word/document.xml"].revert_deletion(del_node)  # Reject deletion
 
+    # Apply many edits, assigning IDs and attributes once at the end
+    with doc.batch():
+        for node in nodes:
+            doc["word/document.xml"].suggest_deletion(node)
+
     # Save
     doc.save()
 """
 
+import contextlib
 import html
+import os
 import random
 import shutil
 import tempfile
@@ -52,6 +60,9 @@ class DocxXMLEditor(XMLEditor):
     - w:author and w:date (for w:ins, w:del, w:comment elements)
     - w:id (for w:ins and w:del elements)
 
+    Inside batch(), attributes are added when the batch ends instead of after
+    every edit.
+
     Attributes:
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
     """
@@ -71,6 +82,40 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self._batch_depth = 0
+        self._pending_nodes = []  # Nodes awaiting attributes until the batch ends
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Defer attribute injection and ID assignment until the block exits.
+
+        Edits inside the block change the DOM immediately, but new w:ins/w:del
+        elements get their w:id (and all new elements their RSID, author and
+        date attributes) only when the outermost batch ends, in a single pass
+        over everything inserted. Batches can be nested.
+
+        Example:
+            with editor.batch():
+                for run in runs:
+                    editor.suggest_deletion(run)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush_batch()
+
+    def flush_batch(self):
+        """Add attributes to all nodes queued by the current batch now."""
+        nodes, self._pending_nodes = self._pending_nodes, []
+        self._apply_attributes([node for node in nodes if self._is_attached(node)])
+
+    def save(self):
+        """Save the edited XML, first adding attributes queued by an open batch."""
+        self.flush_batch()
+        super().save()
 
     def _get_next_change_id(self):
         """Get the next available change ID by checking all tracked change elements."""
@@ -124,12 +169,21 @@ class DocxXMLEditor(XMLEditor):
         - w:comment: gets w:author, w:date, w:initials
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
+        Inside batch(), the nodes are queued and processed when the batch ends.
+
         Args:
             nodes: List of DOM nodes to process
         """
-        from datetime import datetime, timezone
+        if self._batch_depth:
+            self._pending_nodes.extend(nodes)
+        else:
+            self._apply_attributes(nodes)
 
+    def _apply_attributes(self, nodes):
+        """Add attributes to nodes and their descendants in one pass over each subtree."""
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        # Found on the first w:ins/w:del without an ID, then counted up
+        next_change_id = None
 
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
@@ -155,9 +209,9 @@ class DocxXMLEditor(XMLEditor):
                 self._ensure_w14_namespace()
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, inside_deletion):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if inside_deletion:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
@@ -165,9 +219,13 @@ class DocxXMLEditor(XMLEditor):
                     elem.setAttribute("w:rsidR", self.rsid)
 
         def add_tracked_change_attrs(elem):
+            nonlocal next_change_id
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                if next_change_id is None:
+                    next_change_id = self._get_next_change_id()
+                elem.setAttribute("w:id", str(next_change_id))
+                next_change_id += 1
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -204,38 +262,40 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
+        # Walk each subtree once, tracking whether we are inside a w:del on the
+        # way down. Subtrees already visited (e.g. a node queued by a batch and
+        # later wrapped by another queued node) are skipped.
+        visited = set()
         for node in nodes:
-            if node.nodeType != node.ELEMENT_NODE:
+            if node.nodeType != node.ELEMENT_NODE or node in visited:
                 continue
-
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
+            stack = [(node, is_inside_deletion(node))]
+            while stack:
+                elem, inside_deletion = stack.pop()
+                if elem in visited:
+                    continue
+                visited.add(elem)
+
+                if elem.tagName == "w:r":
+                    add_rsid_to_r(elem, inside_deletion)
+                elif elem.tagName in handlers:
+                    handlers[elem.tagName](elem)
+
+                inside_deletion = inside_deletion or elem.tagName == "w:del"
+                stack.extend(
+                    (child, inside_deletion)
+                    for child in reversed(elem.childNodes)
+                    if child.nodeType == child.ELEMENT_NODE
+                )
 
     def replace_node(self, elem, new_content):
         """Replace node with automatic attribute injection."""
@@ -307,6 +367,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Create deletion wrapper
             del_wrapper = self.dom.createElement("w:del")
+            self._unindex(ins_elem)
 
             # Process each run
             for run in runs:
@@ -333,6 +394,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Add del wrapper back to ins
             ins_elem.appendChild(del_wrapper)
+            self._index_later([ins_elem])
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -499,6 +561,7 @@ class DocxXMLEditor(XMLEditor):
             # Check for existing w:delText
             if elem.getElementsByTagName("w:delText"):
                 raise ValueError("w:r element already contains w:delText")
+            self._unindex(elem)
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
@@ -525,6 +588,7 @@ class DocxXMLEditor(XMLEditor):
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
             del_wrapper.appendChild(elem)
+            self._index_later([del_wrapper])
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -535,6 +599,7 @@ class DocxXMLEditor(XMLEditor):
             # Check for existing tracked changes
             if elem.getElementsByTagName("w:ins") or elem.getElementsByTagName("w:del"):
                 raise ValueError("w:p element already contains tracked changes")
+            self._unindex(elem)
 
             # Check if it's a numbered list item
             pPr_list = elem.getElementsByTagName("w:pPr")
@@ -586,6 +651,7 @@ class DocxXMLEditor(XMLEditor):
                 elem.removeChild(child)
                 del_wrapper.appendChild(child)
             elem.appendChild(del_wrapper)
+            self._index_later([elem])
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
@@ -612,6 +678,22 @@ def _generate_rsid() -> str:
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+def _link_or_copy(src, dst):
+    """Hard-link src to dst, copying instead where links aren't possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _copy_unless_same(src, dst):
+    """Copy src to dst unless dst is already the same file (a hard link to it)."""
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        return dst
+    return shutil.copy2(src, dst)
+
+
 class Document:
     """Manages comments in unpacked Word documents."""
 
@@ -622,6 +704,8 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        original_docx=None,
+        link_files=False,
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -633,6 +717,11 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            original_docx: Optional .docx of the unedited document to validate against.
+                If not provided, unpacked_dir is packed into one on first validate().
+            link_files: If True, the working copy hard-links the files of unpacked_dir
+                instead of copying them (default: False). Edited files are replaced
+                on save, never written through the links.
         """
         self.original_path = Path(unpacked_dir)
 
@@ -642,11 +731,15 @@ class Document:
         # Create temporary directory with subdirectories for unpacked content and baseline
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        shutil.copytree(
+            self.original_path,
+            self.unpacked_path,
+            copy_function=_link_or_copy if link_files else shutil.copy2,
+        )
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Validation baseline; packed from the original directory on first use
+        # unless an original .docx was given
+        self._original_docx = Path(original_docx) if original_docx else None
 
         self.word_path = self.unpacked_path / "word"
 
@@ -661,6 +754,14 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Open batch() context, which editors created during the batch join
+        self._batch_stack = None
+
+        # Validators are created on first validate() and reused, so later
+        # validations only re-check the parts that changed
+        self._schema_validator = None
+        self._redlining_validator = None
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -711,8 +812,37 @@ class Document:
             self._editors[xml_path] = DocxXMLEditor(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
+            if self._batch_stack is not None:
+                self._batch_stack.enter_context(self._editors[xml_path].batch())
         return self._editors[xml_path]
 
+    @contextlib.contextmanager
+    def batch(self):
+        """Group many edits so IDs and attributes are assigned once at the end.
+
+        Within the block, suggest_deletion, revert_insertion, add_comment and
+        the editors' replace/insert methods change the DOM immediately, but
+        new elements only get their w:id, RSID, author and date attributes when
+        the block exits, in one pass per XML file. Look up new tracked changes
+        by w:id only after the batch.
+
+        Example:
+            with doc.batch():
+                for run in runs:
+                    doc["word/document.xml"].suggest_deletion(run)
+        """
+        if self._batch_stack is not None:
+            yield self
+            return
+        with contextlib.ExitStack() as stack:
+            for editor in self._editors.values():
+                stack.enter_context(editor.batch())
+            self._batch_stack = stack
+            try:
+                yield self
+            finally:
+                self._batch_stack = None
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -851,6 +981,12 @@ class Document:
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
+    @property
+    def original_docx(self) -> Path:
+        """The unedited document as a .docx, used as the validation baseline."""
+        self._ensure_baseline()
+        return self._original_docx
+
     def validate(self) -> None:
         """
         Validate the document against XSD schema and redlining rules.
@@ -858,18 +994,21 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
-        schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
-        redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
+        if self._schema_validator is None:
+            self._schema_validator = DOCXSchemaValidator(
+                self.unpacked_path, self.original_docx, verbose=False
+            )
+            self._redlining_validator = RedliningValidator(
+                self.unpacked_path,
+                self.original_docx,
+                verbose=False,
+                schema_validator=self._schema_validator,
+            )
 
-        # Run validations
-        if not schema_validator.validate():
+        # Run validations (validators pick up the current state of the files)
+        if not self._schema_validator.validate():
             raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
+        if not self._redlining_validator.validate():
             raise ValueError("Redlining validation failed")
 
     def save(self, destination=None, validate=True) -> None:
@@ -897,10 +1036,26 @@ class Document:
 
         # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() == self.original_path.resolve():
+            # Overwriting the original: build the baseline from it first
+            self._ensure_baseline()
+        shutil.copytree(
+            self.unpacked_path,
+            target_path,
+            copy_function=_copy_unless_same,
+            dirs_exist_ok=True,
+        )
 
     # ==================== Private: Initialization ====================
 
+    def _ensure_baseline(self):
+        """Pack the original directory into a temporary .docx if there is no baseline yet."""
+        if self._original_docx is None:
+            # Outside the unpacked dir, so it isn't copied by save()
+            original_docx = Path(self.temp_dir) / "original.docx"
+            pack_document(self.original_path, original_docx, validate=False)
+            self._original_docx = original_docx
+
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
         if not self.comments_path.exists():
@@ -6,6 +6,11 @@ This module provides XMLEditor, a tool for manipulating XML files with support f
 line-number-based node finding and DOM manipulation. Each element is automatically
 annotated with its original line and column position during parsing.
 
+Lookups go through indexes by tag, by common ID attributes and by source line,
+built on the first get_node call and kept up to date by the editing methods, so
+calling get_node many times on a large file stays fast. Code that changes
+editor.dom directly should call editor.invalidate_index() afterwards.
+
 Example usage:
     editor = XMLEditor("document.xml")
 
@@ -31,12 +36,23 @@ Example usage:
 """
 
 import html
+import os
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
 
+# Attributes whose values are indexed for get_node(attrs=...) lookups
+INDEXED_ATTRS = (
+    "w:id",
+    "w14:paraId",
+    "w14:textId",
+    "w15:paraId",
+    "w16cid:durableId",
+    "Id",
+)
+
 
 class XMLEditor:
     """
@@ -50,6 +66,10 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+
+    The node indexes used by get_node are built lazily. replace_node, insert_after,
+    insert_before and append_to keep them up to date; after changing dom directly,
+    call invalidate_index().
     """
 
     def __init__(self, xml_path):
@@ -72,6 +92,7 @@ class XMLEditor:
 
         parser = _create_line_tracking_parser()
         self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self.invalidate_index()
 
     def get_node(
         self,
@@ -109,40 +130,29 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        normalized_contains = html.unescape(contains) if contains is not None else None
+
+        # Element text is only cached for this call, as self.dom may be
+        # edited directly between calls
+        text_cache = {}
+        candidates = self._find_candidates(tag, attrs, line_number)
+        matches = self._filter_nodes(
+            candidates, tag, attrs, line_number, normalized_contains, text_cache
+        )
+        if not matches:
+            # The DOM may have been changed without invalidate_index(); confirm
+            # with a full scan before reporting that nothing was found
+            self.invalidate_index()
+            matches = self._filter_nodes(
+                self.dom.getElementsByTagName(tag),
+                tag,
+                attrs,
+                line_number,
+                normalized_contains,
+                text_cache,
+            )
 
         if not matches:
             # Build descriptive error message
@@ -180,6 +190,139 @@ class XMLEditor:
             )
         return matches[0]
 
+    def invalidate_index(self):
+        """Discard the node indexes.
+
+        Call this after changing self.dom directly; the indexes are rebuilt
+        on the next get_node call.
+        """
+        self._by_tag = None  # tag -> {element: None}, used as an ordered set
+        self._by_attr = None  # (tag, attribute, value) -> {element: None}
+        self._by_line = None  # source line -> [element, ...]
+        self._unindexed = []  # Inserted nodes not yet added to the indexes
+
+    def _build_index(self):
+        """Index every element in the document in a single pass."""
+        self._by_tag = {}
+        self._by_attr = {}
+        self._by_line = {}
+        self._unindexed = []
+        for elem in _iter_elements(self.dom.documentElement):
+            self._add_to_index(elem)
+            parse_pos = getattr(elem, "parse_position", None)
+            if parse_pos is not None:
+                self._by_line.setdefault(parse_pos[0], []).append(elem)
+
+    def _add_to_index(self, elem):
+        """Add one element to the tag and attribute indexes."""
+        self._by_tag.setdefault(elem.tagName, {})[elem] = None
+        for attr_name in INDEXED_ATTRS:
+            value = elem.getAttribute(attr_name)
+            if value:
+                key = (elem.tagName, attr_name, value)
+                self._by_attr.setdefault(key, {})[elem] = None
+
+    def _find_candidates(self, tag, attrs, line_number):
+        """Return the elements that may match, using the narrowest index available.
+
+        Candidates still have to be checked with _filter_nodes. Elements
+        without a source line are never candidates for a line_number lookup.
+        """
+        if self._by_tag is None:
+            self._build_index()
+        elif self._unindexed:
+            # Index inserted nodes now, after subclasses have added attributes
+            for node in self._unindexed:
+                for elem in _iter_elements(node):
+                    self._add_to_index(elem)
+            self._unindexed = []
+
+        if line_number is not None:
+            if isinstance(line_number, range) and len(line_number) > len(self._by_line):
+                lines = [line for line in self._by_line if line in line_number]
+            else:
+                lines = line_number if isinstance(line_number, range) else [line_number]
+            return [elem for line in lines for elem in self._by_line.get(line, ())]
+
+        for attr_name, attr_value in (attrs or {}).items():
+            if attr_name in INDEXED_ATTRS:
+                return list(self._by_attr.get((tag, attr_name, attr_value), ()))
+
+        return list(self._by_tag.get(tag, ()))
+
+    def _filter_nodes(self, nodes, tag, attrs, line_number, contains, text_cache):
+        """Return the elements in nodes that are in the document and match all filters.
+
+        text_cache maps elements to their text and is filled in as needed.
+        """
+        matches = []
+        for elem in nodes:
+            if elem.tagName != tag:
+                continue
+
+            # Check line_number filter
+            if line_number is not None:
+                parse_pos = getattr(elem, "parse_position", (None,))
+                elem_line = parse_pos[0]
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    elem.getAttribute(attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter
+            if contains is not None:
+                elem_text = text_cache.get(elem)
+                if elem_text is None:
+                    elem_text = text_cache[elem] = self._get_element_text(elem)
+                if contains not in elem_text:
+                    continue
+
+            # Indexes may still list elements that have since been removed
+            if not self._is_attached(elem):
+                continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+        return matches
+
+    def _is_attached(self, node):
+        """Return True if node is part of the document (not removed from it)."""
+        while node is not None:
+            if node is self.dom:
+                return True
+            node = node.parentNode
+        return False
+
+    def _unindex(self, node):
+        """Drop node and its descendants from the indexes before it is changed or removed."""
+        if self._by_tag is None or node.nodeType != node.ELEMENT_NODE:
+            return
+        for elem in _iter_elements(node):
+            self._by_tag.get(elem.tagName, {}).pop(elem, None)
+            for attr_name in INDEXED_ATTRS:
+                value = elem.getAttribute(attr_name)
+                if value:
+                    key = (elem.tagName, attr_name, value)
+                    self._by_attr.get(key, {}).pop(elem, None)
+
+    def _index_later(self, nodes):
+        """Queue inserted (or changed) nodes for indexing on the next lookup."""
+        for node in nodes:
+            if self._by_tag is not None and node.nodeType == node.ELEMENT_NODE:
+                self._unindexed.append(node)
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
@@ -219,9 +362,11 @@ class XMLEditor:
         """
         parent = elem.parentNode
         nodes = self._parse_fragment(new_content)
+        self._unindex(elem)
         for node in nodes:
             parent.insertBefore(node, elem)
         parent.removeChild(elem)
+        self._index_later(nodes)
         return nodes
 
     def insert_after(self, elem, xml_content):
@@ -246,6 +391,7 @@ class XMLEditor:
                 parent.insertBefore(node, next_sibling)
             else:
                 parent.appendChild(node)
+        self._index_later(nodes)
         return nodes
 
     def insert_before(self, elem, xml_content):
@@ -266,6 +412,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             parent.insertBefore(node, elem)
+        self._index_later(nodes)
         return nodes
 
     def append_to(self, elem, xml_content):
@@ -285,6 +432,7 @@ class XMLEditor:
         nodes = self._parse_fragment(xml_content)
         for node in nodes:
             elem.appendChild(node)
+        self._index_later(nodes)
         return nodes
 
     def get_next_rid(self):
@@ -304,10 +452,13 @@ class XMLEditor:
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). The file is replaced
+        rather than overwritten, so hard links to the old file are left alone.
         """
         content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        temp_path = self.xml_path.with_name(self.xml_path.name + ".tmp")
+        temp_path.write_bytes(content)
+        os.replace(temp_path, self.xml_path)
 
     def _parse_fragment(self, xml_content):
         """
@@ -343,6 +494,16 @@ class XMLEditor:
         return nodes
 
 
+def _iter_elements(node):
+    """Yield node (if it is an element) and all its descendant elements in document order."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.nodeType == node.ELEMENT_NODE:
+            yield node
+            stack.extend(reversed(node.childNodes))
+
+
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 import json
 import sys
 
+from overlaps import find_overlaps
+
 
 # Script to check that the `fields.json` file that Claude creates when analyzing PDFs
 # does not have overlapping bounding boxes. See FORMS.md.
@@ -30,20 +32,38 @@ def get_bounding_box_messages(fields_json_stream) -> list[str]:
         rects_and_fields.append(RectAndField(f["label_bounding_box"], "label", f))
         rects_and_fields.append(RectAndField(f["entry_bounding_box"], "entry", f))
 
+    # Find the intersecting boxes on each page; maps the index of a box to the
+    # indices of the later boxes it intersects, in order.
+    indices_by_page = {}
+    for i, rf in enumerate(rects_and_fields):
+        indices_by_page.setdefault(rf.field["page_number"], []).append(i)
+    intersections = {}
+    for indices in indices_by_page.values():
+        rects = [rects_and_fields[i].rect for i in indices]
+        pairs = [(i, j) for i, j, _, _ in find_overlaps(rects)]
+        # find_overlaps ignores boxes without a positive width and height, but
+        # those can still intersect other boxes, so check them pairwise.
+        degenerate = [k for k, r in enumerate(rects) if not (r[2] > r[0] and r[3] > r[1])]
+        degenerate_set = set(degenerate)
+        for k in degenerate:
+            for m in range(len(rects)):
+                if m != k and (m not in degenerate_set or m > k) and rects_intersect(rects[k], rects[m]):
+                    pairs.append((min(k, m), max(k, m)))
+        for i, j in sorted(pairs):
+            intersections.setdefault(indices[i], []).append(indices[j])
+
     has_error = False
     for i, ri in enumerate(rects_and_fields):
-        # This is O(N^2); we can optimize if it becomes a problem.
-        for j in range(i + 1, len(rects_and_fields)):
+        for j in intersections.get(i, []):
             rj = rects_and_fields[j]
-            if ri.field["page_number"] == rj.field["page_number"] and rects_intersect(ri.rect, rj.rect):
-                has_error = True
-                if ri.field is rj.field:
-                    messages.append(f"FAILURE: intersection between label and entry bounding boxes for `{ri.field['description']}` ({ri.rect}, {rj.rect})")
-                else:
-                    messages.append(f"FAILURE: intersection between {ri.rect_type} bounding box for `{ri.field['description']}` ({ri.rect}) and {rj.rect_type} bounding box for `{rj.field['description']}` ({rj.rect})")
-                if len(messages) >= 20:
-                    messages.append("Aborting further checks; fix bounding boxes and try again")
-                    return messages
+            has_error = True
+            if ri.field is rj.field:
+                messages.append(f"FAILURE: intersection between label and entry bounding boxes for `{ri.field['description']}` ({ri.rect}, {rj.rect})")
+            else:
+                messages.append(f"FAILURE: intersection between {ri.rect_type} bounding box for `{ri.field['description']}` ({ri.rect}) and {rj.rect_type} bounding box for `{rj.field['description']}` ({rj.rect})")
+            if len(messages) >= 20:
+                messages.append("Aborting further checks; fix bounding boxes and try again")
+                return messages
         if ri.rect_type == "entry":
             if "entry_text" in ri.field:
                 font_size = ri.field["entry_text"].get("font_size", 14)
@@ -0,0 +1,495 @@
+"""
+Persistent headless LibreOffice workers for conversions and recalculation.
+
+Starting `soffice --headless` takes seconds before any real work is done.
+SofficePool keeps a small number of LibreOffice listener processes running
+and sends each job to one of them over UNO, so only the first job pays the
+startup cost. Workers are health-checked before each job, restarted after a
+fixed number of jobs, and killed and restarted when a job times out.
+
+The UNO Python bindings (python3-uno) are optional: without them convert()
+runs each job in a one-off `soffice --headless` process, as before, and
+HAVE_UNO is False.
+
+Usage:
+    from soffice import convert, recalculate
+
+    pdf_path = convert("deck.pptx", "out", "pdf", timeout=60)
+    recalculate("model.xlsx", timeout=30)
+
+The shared pool used by convert() and recalculate() has SOFFICE_WORKERS
+workers (default: 1).
+
+Conversion results are cached on disk, keyed by the SHA-256 of the input file
+and the conversion target, so converting an unchanged document again copies
+the earlier output without running LibreOffice. Failed conversions are not
+cached. The cache lives in SOFFICE_CACHE_DIR (default:
+~/.cache/soffice-conversions) and least recently used entries are evicted once
+it grows past SOFFICE_CACHE_SIZE bytes (default: 1 GiB; 0 disables the cache).
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import queue
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+except ImportError:
+    uno = None
+
+HAVE_UNO = uno is not None
+
+# Restart a worker after this many jobs, so leaks in long-lived soffice
+# processes don't build up
+DEFAULT_MAX_JOBS = 100
+
+# Seconds to wait for a new soffice process to accept connections
+STARTUP_TIMEOUT = 60
+
+# PDF export filters by input document type ("--convert-to pdf" picks these)
+PDF_FILTERS = {
+    ".docx": "writer_pdf_Export",
+    ".doc": "writer_pdf_Export",
+    ".odt": "writer_pdf_Export",
+    ".pptx": "impress_pdf_Export",
+    ".ppt": "impress_pdf_Export",
+    ".odp": "impress_pdf_Export",
+    ".xlsx": "calc_pdf_Export",
+    ".xls": "calc_pdf_Export",
+    ".ods": "calc_pdf_Export",
+}
+
+# Default size limit of the conversion cache in bytes
+DEFAULT_CACHE_SIZE = 1 << 30
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+_shared_cache = None
+
+
+class SofficeWorker:
+    """One headless LibreOffice process listening for UNO connections."""
+
+    def __init__(self):
+        self.process = None
+        self.desktop = None
+        self.profile_dir = None
+        self.jobs = 0  # Jobs run since the process was started
+
+    def start(self):
+        """Start soffice with a private profile and connect to it.
+
+        Raises:
+            FileNotFoundError: If soffice is not installed
+            RuntimeError: If soffice exits or doesn't accept connections in time
+        """
+        self.profile_dir = tempfile.mkdtemp(prefix="soffice-worker-")
+        port = _free_port()
+        connection = (
+            f"socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        )
+        self.process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"--accept={connection}",
+                f"-env:UserInstallation={Path(self.profile_dir).as_uri()}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}")
+                break
+            except NoConnectException:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("LibreOffice worker failed to start")
+                time.sleep(0.2)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        self.jobs = 0
+
+    def is_healthy(self):
+        """Return True if the process is running and answers a UNO call."""
+        if self.process is None or self.process.poll() is not None:
+            return False
+        try:
+            self.desktop.getComponents()
+            return True
+        except Exception:
+            return False
+
+    def run(self, job, timeout=None):
+        """Run job(desktop) in this worker and return its result.
+
+        If the job doesn't finish within timeout seconds, the soffice process
+        is killed (the job can't be cancelled otherwise) and TimeoutError is
+        raised; the worker has to be started again before its next job.
+        """
+        self.jobs += 1
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = job(self.desktop)
+            except BaseException as e:
+                outcome["error"] = e
+
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        if thread.is_alive():
+            self.stop(kill=True)
+            raise TimeoutError(f"LibreOffice job timed out after {timeout}s")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("result")
+
+    def stop(self, kill=False):
+        """Shut soffice down (or kill it) and remove its profile."""
+        if self.process is not None:
+            if not kill and self.desktop is not None:
+                try:
+                    self.desktop.terminate()
+                except Exception:
+                    pass
+            try:
+                self.process.wait(timeout=0 if kill else 10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        if self.profile_dir is not None:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+        self.process = None
+        self.desktop = None
+        self.profile_dir = None
+
+
+class SofficePool:
+    """A small pool of SofficeWorkers shared by concurrent callers.
+
+    Workers are started on first use. Before each job the worker is checked
+    and restarted if it died or has run max_jobs jobs.
+    """
+
+    def __init__(self, size=1, max_jobs=DEFAULT_MAX_JOBS):
+        self.size = max(1, size)
+        self.max_jobs = max_jobs
+        self._idle = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+
+    def run(self, job, timeout=None):
+        """Run job(desktop) on an idle worker and return its result."""
+        worker = self._acquire()
+        try:
+            if worker.jobs >= self.max_jobs or not worker.is_healthy():
+                worker.stop()
+                worker.start()
+            return worker.run(job, timeout)
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        """Stop all workers."""
+        with self._lock:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = []
+            self._idle = queue.Queue()
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle.empty() and len(self._workers) < self.size:
+                worker = SofficeWorker()
+                self._workers.append(worker)
+                return worker
+        return self._idle.get()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ConversionCache:
+    """Content-addressed on-disk cache of conversion results.
+
+    Each entry is a directory named after the cache key, holding the files a
+    successful conversion produced and a manifest.json recording the input
+    file's stem (output names start with it). Failed conversions are not
+    cached, as a failure can be transient (e.g. a locked profile). Entries
+    are written to a temporary directory and renamed into place, so
+    concurrent processes can share a cache. An entry's mtime is
+    refreshed whenever it is used, and the least recently used entries are
+    removed when the total size exceeds max_size.
+    """
+
+    def __init__(self, directory, max_size=DEFAULT_CACHE_SIZE):
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    def key(self, path, convert_to):
+        """Return the cache key for converting path to convert_to."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\0" + convert_to.encode())
+        return digest.hexdigest()
+
+    def fetch(self, key, outdir, stem):
+        """Copy a cached result into outdir.
+
+        Returns:
+            list[Path]: The files copied, or None if key isn't cached
+        """
+        entry = self.directory / key
+        try:
+            manifest = json.loads((entry / "manifest.json").read_text())
+            os.utime(entry)
+        except (OSError, ValueError):
+            return None
+        # Entries without files (e.g. failures cached by older versions) are misses
+        if "error" in manifest or not manifest.get("files"):
+            return None
+
+        copied = []
+        try:
+            for name in manifest["files"]:
+                if name.startswith(manifest["stem"]):
+                    target = Path(outdir) / (stem + name[len(manifest["stem"]) :])
+                else:
+                    target = Path(outdir) / name
+                shutil.copyfile(entry / "files" / name, target)
+                copied.append(target)
+        except OSError:
+            # Evicted by another process while copying
+            return None
+        return copied
+
+    def store(self, key, files, stem):
+        """Add the output files of a successful conversion to the cache."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.directory))
+        try:
+            (staging / "files").mkdir()
+            for file in files:
+                shutil.copyfile(file, staging / "files" / file.name)
+            manifest = {"stem": stem, "files": [file.name for file in files]}
+            (staging / "manifest.json").write_text(json.dumps(manifest))
+            os.rename(staging, self.directory / key)
+        except OSError:
+            # Another process stored the same key first
+            shutil.rmtree(staging, ignore_errors=True)
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_size."""
+        entries = []
+        total = 0
+        for entry in self.directory.iterdir():
+            if entry.name.startswith(".tmp-"):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry.rglob("*") if f.is_file())
+                entries.append((entry.stat().st_mtime, size, entry))
+            except OSError:
+                continue
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+def get_pool():
+    """Return the process-wide pool, which is closed when the process exits."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SofficePool(size=int(os.environ.get("SOFFICE_WORKERS", "1")))
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
+def get_cache():
+    """Return the process-wide conversion cache, or None if it is disabled."""
+    global _shared_cache
+    if _shared_cache is None:
+        directory = os.environ.get("SOFFICE_CACHE_DIR") or (
+            Path.home() / ".cache" / "soffice-conversions"
+        )
+        max_size = int(os.environ.get("SOFFICE_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+        _shared_cache = ConversionCache(directory, max_size) if max_size > 0 else False
+    return _shared_cache or None
+
+
+def convert(path, outdir, convert_to, timeout=None, pool=None, cache=None):
+    """Convert a document like `soffice --headless --convert-to`.
+
+    Args:
+        path: Document to convert
+        outdir: Directory for the output, named <stem>.<extension>
+        convert_to: Output format as for --convert-to, e.g. "pdf" or "html:HTML"
+        timeout: Seconds to allow for the conversion (None = no limit)
+        pool: SofficePool to use (default: the shared pool)
+        cache: ConversionCache to use (default: the shared cache; False = none)
+
+    Returns:
+        Path: The converted file
+
+    Raises:
+        FileNotFoundError: If soffice is not installed
+        TimeoutError: If the conversion didn't finish in time
+        RuntimeError: If the conversion failed
+    """
+    path = Path(path).resolve()
+    outdir = Path(outdir).resolve()
+    extension, _, filter_name = convert_to.partition(":")
+    filter_name = filter_name or PDF_FILTERS.get(path.suffix.lower())
+    output = outdir / f"{path.stem}.{extension}"
+
+    if cache is None:
+        cache = get_cache()
+    if cache:
+        key = cache.key(path, convert_to)
+        if cache.fetch(key, outdir, path.stem):
+            return output
+        existing = set(outdir.iterdir())
+
+    message = None
+    if uno is None or (extension == "pdf" and filter_name is None):
+        message = _run_soffice(
+            ["--convert-to", convert_to, "--outdir", str(outdir), str(path)],
+            timeout,
+        )
+    else:
+
+        def job(desktop):
+            document = _load(desktop, path)
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(str(output)),
+                    _properties(FilterName=filter_name, Overwrite=True),
+                )
+            finally:
+                document.close(True)
+
+        (pool or get_pool()).run(job, timeout)
+
+    if not output.exists():
+        raise RuntimeError(
+            message or f"Conversion of {path.name} to {convert_to} failed"
+        )
+    if cache:
+        # Keep everything the conversion wrote, e.g. images next to HTML, and
+        # the output itself even if it overwrote an existing file
+        produced = set(outdir.iterdir()) - existing
+        produced.add(output)
+        cache.store(key, sorted(f for f in produced if f.is_file()), path.stem)
+    return output
+
+
+def recalculate(path, timeout=None, pool=None):
+    """Recalculate all formulas in a spreadsheet and save it in place.
+
+    Requires the UNO bindings (HAVE_UNO).
+
+    Raises:
+        FileNotFoundError: If soffice is not installed
+        TimeoutError: If recalculation didn't finish in time
+        RuntimeError: If LibreOffice reported an error
+    """
+    path = Path(path).resolve()
+
+    def job(desktop):
+        document = _load(desktop, path, read_only=False)
+        try:
+            document.calculateAll()
+            document.store()
+        finally:
+            document.close(True)
+
+    (pool or get_pool()).run(job, timeout)
+
+
+def _run_soffice(args, timeout):
+    """Run a one-off headless soffice process and return its stderr output.
+
+    Used when the UNO bindings aren't available.
+    """
+    try:
+        result = subprocess.run(
+            ["soffice", "--headless", *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        raise TimeoutError(f"LibreOffice timed out after {timeout}s")
+    return result.stderr.strip()
+
+
+def _load(desktop, path, read_only=True):
+    """Open a document hidden in the worker."""
+    document = desktop.loadComponentFromURL(
+        uno.systemPathToFileUrl(str(path)),
+        "_blank",
+        0,
+        _properties(Hidden=True, ReadOnly=read_only),
+    )
+    if document is None:
+        raise RuntimeError(f"LibreOffice could not open {path.name}")
+    return document
+
+
+def _properties(**values):
+    """Return a tuple of UNO PropertyValues."""
+    properties = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        properties.append(prop)
+    return tuple(properties)
+
+
+def _free_port():
+    """Return a TCP port on localhost that is currently free."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -1,29 +1,60 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Usage:
+    python unpack.py <office_file> <output_dir> [--jobs N]
+"""
+
+import argparse
+import concurrent.futures
 import random
-import sys
-import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
+from pack import pretty_xml_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file")
+    parser.add_argument("input_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes for pretty-printing parts (default: 1)",
+    )
+    args = parser.parse_args()
+    input_file, output_dir = args.input_file, args.output_dir
+
+    # Extract and format
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    zipfile.ZipFile(input_file).extractall(output_path)
 
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
+    # Pretty print all XML files
+    xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
+    if args.jobs > 1 and len(xml_files) > 1:
+        chunksize = max(1, len(xml_files) // (args.jobs * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            # Consume the results so that worker errors are raised here
+            list(executor.map(pretty_print_file, xml_files, chunksize=chunksize))
+    else:
+        for xml_file in xml_files:
+            pretty_print_file(xml_file)
 
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
+    # For .docx files, suggest an RSID for tracked changes
+    if input_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def pretty_print_file(xml_file):
+    """Pretty-print an XML file in place."""
     content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
+    xml_file.write_bytes(pretty_xml_bytes(content))
+
 
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+if __name__ == "__main__":
+    main()
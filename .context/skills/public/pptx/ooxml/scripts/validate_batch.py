@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Command line tool to validate many Office documents in one run, writing one JSON line per document.
+
+Usage:
+    python validate_batch.py [<target> ...] [--input <list>] [--original <original_file>] [--jobs N] [--streaming]
+
+Each target is an unpacked document directory or a .docx/.pptx file (which is
+extracted to a temporary directory first). Targets can also be read from a
+file, or from stdin with --input -, one per line, optionally followed by a tab
+and the original file to compare that target with. Without an original file,
+every XSD error counts as new and the tracked changes check is skipped.
+
+Documents are validated concurrently by a pool of long-lived worker processes.
+Each worker compiles the XSD schemas once at startup and keeps the original
+packages it has read, so validating many documents generated from the same
+template only reads and checks the template once per worker.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
+
+# Validators to run per document type; RedliningValidator needs an original
+VALIDATORS = {
+    ".docx": [DOCXSchemaValidator, RedliningValidator],
+    ".pptx": [PPTXSchemaValidator],
+}
+
+# Main content folder of an unpacked document -> document type
+CONTENT_FOLDERS = {"word": ".docx", "ppt": ".pptx", "xl": ".xlsx"}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate many Office documents, writing JSON lines to stdout"
+    )
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        help="Unpacked document directories or .docx/.pptx files",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        help="File listing targets, one per line as <target>[<TAB><original>] (- for stdin)",
+    )
+    parser.add_argument(
+        "--original",
+        help="Original file to compare targets with when a line doesn't name one",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream very large parts instead of loading them whole (lower memory use)",
+    )
+    args = parser.parse_args()
+
+    if not args.targets and not args.input:
+        parser.error("no targets given (pass targets or --input)")
+
+    jobs = _read_jobs(args.targets, args.input, args.original)
+
+    success = True
+    for result in validate_many(jobs, workers=args.jobs, streaming=args.streaming):
+        success = success and result["passed"]
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+    sys.exit(0 if success else 1)
+
+
+def _read_jobs(targets, input_file, default_original):
+    """Yield (target, original_file) pairs from the command line and the input list."""
+    for target in targets:
+        yield target, default_original
+
+    if input_file is None:
+        return
+    with contextlib.ExitStack() as stack:
+        if input_file == "-":
+            lines = sys.stdin
+        else:
+            lines = stack.enter_context(open(input_file, encoding="utf-8"))
+        for line in lines:
+            line = line.rstrip("\r\n")
+            if not line.strip():
+                continue
+            target, _, original = line.partition("\t")
+            yield target, original or default_original
+
+
+def validate_many(jobs, workers=None, streaming=False):
+    """Validate (target, original_file) pairs concurrently.
+
+    jobs can be any iterable, including an unbounded stream: only a few jobs
+    per worker are queued at a time. Results are yielded in input order.
+
+    Args:
+        jobs: Iterable of (target, original_file) pairs; original_file may be None
+        workers: Number of worker processes (None or 1 = validate in this process)
+        streaming: Use streaming validation for very large parts
+
+    Yields:
+        dict: Result of validate_document for each job
+    """
+    if not workers or workers <= 1:
+        BaseSchemaValidator.warm_up_schemas()
+        for target, original in jobs:
+            yield validate_document(target, original, streaming)
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker
+    ) as executor:
+        pending = collections.deque()
+        for target, original in jobs:
+            pending.append(
+                executor.submit(validate_document, target, original, streaming)
+            )
+            if len(pending) >= workers * 4:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _init_worker():
+    """Process pool initializer: compile all schemas before the first document."""
+    BaseSchemaValidator.warm_up_schemas()
+
+
+def validate_document(target, original_file=None, streaming=False):
+    """Run the validators for one document and return its results as a dict.
+
+    Printed validator output is discarded; the returned dict carries the
+    structured results of each validator (see ValidationResult.to_dict).
+    Problems that stop a document from being validated at all are reported
+    in its "error" field instead of being raised.
+    """
+    start = time.perf_counter()
+    result = {
+        "target": str(target),
+        "original": str(original_file) if original_file else None,
+        "passed": False,
+        "validators": [],
+    }
+
+    try:
+        with contextlib.ExitStack() as stack:
+            target = Path(target)
+            original_file = Path(original_file) if original_file else None
+            file_type = _document_type(target, original_file)
+            if file_type not in VALIDATORS:
+                raise ValueError(f"Validation not supported for file type {file_type}")
+
+            if target.is_dir():
+                unpacked_dir = target
+            else:
+                temp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+                with zipfile.ZipFile(target, "r") as zip_ref:
+                    zip_ref.extractall(temp_dir)
+                unpacked_dir = Path(temp_dir)
+
+            passed = True
+            schema_validator = None
+            with contextlib.redirect_stdout(io.StringIO()):
+                for V in VALIDATORS[file_type]:
+                    if issubclass(V, BaseSchemaValidator):
+                        validator = V(unpacked_dir, original_file, streaming=streaming)
+                        schema_validator = validator
+                    elif original_file is None:
+                        continue
+                    else:
+                        validator = V(
+                            unpacked_dir,
+                            original_file,
+                            schema_validator=schema_validator,
+                        )
+                    if not validator.validate():
+                        passed = False
+                    result["validators"].append(validator.result.to_dict())
+            result["passed"] = passed
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["duration"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def _document_type(target, original_file):
+    """Return the file extension of the document type being validated."""
+    if original_file is not None:
+        return original_file.suffix.lower()
+    if not target.is_dir():
+        return target.suffix.lower()
+    for folder, file_type in CONTENT_FOLDERS.items():
+        if (target / folder).is_dir():
+            return file_type
+    raise ValueError(f"Cannot tell the document type of {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,41 @@
 Base validator with common validation logic for document files.
 """
 
+import collections
+import concurrent.futures
+import copy
+import hashlib
 import re
+import threading
+import zipfile
 from pathlib import Path
 
 import lxml.etree
 
+from .rules import (
+    NamespaceRule,
+    RelationshipIdRule,
+    RuleEngine,
+    UniqueIdRule,
+    iterparse_events,
+)
+from .results import ValidationError, ValidationResult, validation_check
+
+# Compiled XSD schemas shared by all validator instances in this process,
+# keyed by resolved schema path
+_SCHEMA_POOL = {}
+_SCHEMA_POOL_LOCK = threading.Lock()
+
+# Original packages shared by all validator instances in this process, most
+# recently used last: (validator class, resolved path, mtime_ns, size) ->
+# (part name -> bytes, part name -> set of XSD error messages)
+_ORIGINAL_POOL = collections.OrderedDict()
+_ORIGINAL_POOL_LOCK = threading.Lock()
+_ORIGINAL_POOL_SIZE = 16
+
+# Validator used by each XSD worker process (see validate_against_xsd)
+_worker_validator = None
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -44,6 +74,17 @@ class BaseSchemaValidator:
         "sectionlst",  # PowerPoint sections - sldId elements reference slides by ID
     }
 
+    # In streaming mode, parts larger than this (in bytes) are never held in
+    # memory as a whole except for XSD validation, which needs the full tree
+    STREAMING_THRESHOLD = 8 * 1024 * 1024
+
+    # Directory containing the bundled XSD schemas
+    SCHEMAS_DIR = Path(__file__).parent.parent.parent / "schemas"
+
+    # Structural checks that run together in a single traversal per part
+    # Subclasses extend this with format-specific rules
+    RULES = [NamespaceRule, UniqueIdRule, RelationshipIdRule]
+
     # Mapping of element names to expected relationship types
     # Subclasses should override this with format-specific mappings
     ELEMENT_RELATIONSHIP_TYPES = {}
@@ -110,27 +151,220 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, workers=None, streaming=False
+    ):
         self.unpacked_dir = Path(unpacked_dir).resolve()
-        self.original_file = Path(original_file)
+        # Without an original package every XSD error counts as new
+        self.original_file = Path(original_file) if original_file else None
         self.verbose = verbose
+        # Number of processes for XSD validation (None or 1 = sequential)
+        self.workers = workers
+        # Stream parts larger than STREAMING_THRESHOLD instead of caching them
+        self.streaming = streaming
+
+        # Structured record of the checks run since the last validate() call
+        self.result = ValidationResult(type(self).__name__)
 
         # Set schemas directory
-        self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+        self.schemas_dir = self.SCHEMAS_DIR
 
         # Get all XML and .rels files
-        patterns = ["*.xml", "*.rels"]
-        self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
-        ]
+        self.xml_files = self._find_xml_files()
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed trees shared by all checks: path -> ((mtime_ns, size), tree or error)
+        self._xml_cache = {}
+
+        # Content hashes of files in unpacked_dir: path -> ((mtime_ns, size), sha256)
+        self._file_digests = {}
+
+        # Results of earlier runs, kept with the hashes of the files they depend
+        # on so that a reused validator only re-checks what changed.
+        # Structural rules: part -> (part hash, .rels hash) when last checked,
+        # rule class -> {part -> errors}, rule class -> parts affecting others
+        self._rule_part_keys = {}
+        self._rule_part_errors = {}
+        self._rule_cross_parts = {}
+        # XSD validation: part -> ((part hash, original key), (is_valid, new_errors))
+        self._xsd_results = {}
+        # Package-wide checks: check name -> (dependency key, errors)
+        self._check_results = {}
+
+        # Original package XML parts, read lazily: part name -> bytes
+        # (not kept in streaming mode, where parts are read on demand)
+        self._original_parts = None
+        # Memoized XSD errors of original parts: part name -> set of messages
+        self._original_errors = None
+        # Key of the version of the original file that was read (see _load_original)
+        self._original_key = None
+
     def validate(self):
-        """Run all validation checks and return True if all pass."""
+        """Run all validation checks and return True if all pass.
+
+        Details of each check are recorded in self.result.
+        """
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def _find_xml_files(self):
+        """Return all XML and .rels files in the unpacked directory."""
+        patterns = ["*.xml", "*.rels"]
+        return [f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)]
+
+    def refresh(self):
+        """Pick up files added to or removed from the unpacked directory.
+
+        A validator can be reused after the unpacked files are edited: each
+        check keeps the content hashes its last results were based on and
+        re-runs only for parts that changed. Subclass validate() methods call
+        this first, so only code calling individual checks needs it.
+        """
+        self.xml_files = self._find_xml_files()
+
+    def _file_digest(self, path):
+        """Return the SHA-256 of a file's content, or None if it doesn't exist.
+
+        Digests are cached and recomputed only when the file's mtime or size
+        changes.
+        """
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = str(path)
+
+        cached = self._file_digests.get(key)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, hashlib.sha256(path.read_bytes()).hexdigest())
+            self._file_digests[key] = cached
+        return cached[1]
+
+    def _cached_check(self, name, key, check):
+        """Return check()'s errors, reusing the last result while key is unchanged."""
+        cached = self._check_results.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, check())
+            self._check_results[name] = cached
+        return cached[1]
+
+    def _part_name(self, path):
+        """Return the path of a file relative to the unpacked dir, with forward slashes."""
+        return Path(path).relative_to(self.unpacked_dir).as_posix()
+
+    def _is_streamed(self, xml_file):
+        """Return True if a part is too large to keep in memory in streaming mode."""
+        return (
+            self.streaming and Path(xml_file).stat().st_size > self.STREAMING_THRESHOLD
+        )
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML file once and return the shared lxml ElementTree.
+
+        Trees are cached by path and re-parsed only when the file's mtime or
+        size changes. The returned tree is shared between checks and must not
+        be modified; checks that need an edited tree work on a copy.
+        Files outside the unpacked directory, and parts that are streamed
+        (see _is_streamed), are parsed without caching.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed (the
+                error is cached as well, so it is raised again on each call)
+        """
+        xml_file = Path(xml_file)
+        if not xml_file.is_relative_to(self.unpacked_dir) or self._is_streamed(
+            xml_file
+        ):
+            return lxml.etree.parse(str(xml_file))
+
+        stat = xml_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = str(xml_file)
+
+        cached = self._xml_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            try:
+                result = lxml.etree.parse(key)
+            except lxml.etree.XMLSyntaxError as e:
+                result = e
+            cached = (stamp, result)
+            self._xml_cache[key] = cached
+
+        if isinstance(cached[1], Exception):
+            raise cached[1]
+        return cached[1]
+
+    def _rule_errors(self, rule_class):
+        """Return the errors found by a structural rule.
+
+        Every rule in RULES is run by one RuleEngine pass, which visits each
+        element of each part once. Results are kept per part, and later calls
+        only walk parts whose content (or .rels file) changed since. A rule
+        that isn't in RULES is run on its own.
+        """
+        if rule_class not in self.RULES:
+            engine = RuleEngine([rule_class(self)])
+            (rule,) = engine.run(
+                self.xml_files, self.unpacked_dir, self._parse_xml, self._is_streamed
+            )
+            return rule.errors
+
+        self._update_rule_results()
+        part_errors = self._rule_part_errors[rule_class]
+        return [error for xml_file in self.xml_files for error in part_errors[xml_file]]
+
+    def _update_rule_results(self):
+        """Run RULES on the parts that changed since they were last checked.
+
+        If a changed or removed part is one that affects the results of other
+        parts (see ValidationRule.cross_part_files), that rule is re-run on
+        every part instead.
+        """
+        keys = {}
+        for xml_file in self.xml_files:
+            rels_file = xml_file.parent / "_rels" / f"{xml_file.name}.rels"
+            keys[xml_file] = (self._file_digest(xml_file), self._file_digest(rels_file))
+
+        dirty = [f for f in self.xml_files if self._rule_part_keys.get(f) != keys[f]]
+        removed = set(self._rule_part_keys) - set(keys)
+        if not dirty and not removed:
+            return
+        changed = removed.union(dirty)
+        partial = len(dirty) < len(self.xml_files)
+
+        rerun = []
+        engine = RuleEngine(cls(self) for cls in self.RULES)
+        for rule in engine.run(
+            dirty, self.unpacked_dir, self._parse_xml, self._is_streamed
+        ):
+            rule_class = type(rule)
+            cross_parts = self._rule_cross_parts.get(rule_class, set())
+            if partial and (cross_parts | rule.cross_part_files) & changed:
+                rerun.append(rule_class)
+                continue
+            self._rule_part_errors.setdefault(rule_class, {}).update(
+                rule.errors_by_part
+            )
+            self._rule_cross_parts[rule_class] = (
+                cross_parts - changed
+            ) | rule.cross_part_files
+
+        if rerun:
+            engine = RuleEngine(cls(self) for cls in rerun)
+            for rule in engine.run(
+                self.xml_files, self.unpacked_dir, self._parse_xml, self._is_streamed
+            ):
+                self._rule_part_errors[type(rule)] = rule.errors_by_part
+                self._rule_cross_parts[type(rule)] = rule.cross_part_files
+
+        for xml_file in removed:
+            del self._rule_part_keys[xml_file]
+        self._rule_part_keys.update(keys)
+
+    @validation_check("xml")
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
@@ -138,18 +372,31 @@ class BaseSchemaValidator:
         for xml_file in self.xml_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                if self._is_streamed(xml_file):
+                    for _ in iterparse_events(str(xml_file)):
+                        pass
+                else:
+                    self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
+                    ValidationError(
+                        "xml_syntax",
+                        e.msg,
+                        file=self._part_name(xml_file),
+                        line=e.lineno,
+                    )
                 )
             except Exception as e:
                 errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
+                    ValidationError(
+                        "part_error",
+                        f"Unexpected error: {str(e)}",
+                        file=self._part_name(xml_file),
+                    )
                 )
 
+        self.result.add_errors(errors)
+
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
             for error in errors:
@@ -160,26 +407,12 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    @validation_check("namespaces")
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
-        errors = []
+        errors = self._rule_errors(NamespaceRule)
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+        self.result.add_errors(errors)
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
@@ -190,95 +423,12 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    @validation_check("unique_ids")
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
-        errors = []
-        global_ids = {}  # Track globally unique IDs across all files
+        errors = self._rule_errors(UniqueIdRule)
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
-
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        # Skip if element is inside an excluded container
-                        # (e.g., <p14:sldId> inside <p14:sectionLst> is a reference, not a definition)
-                        in_excluded_container = any(
-                            ancestor.tag.split("}")[-1].lower() in self.EXCLUDED_ID_CONTAINERS
-                            for ancestor in elem.iterancestors()
-                        )
-                        if in_excluded_container:
-                            continue
-
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        self.result.add_errors(errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -290,12 +440,11 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    @validation_check("file_references")
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
         """
-        errors = []
-
         # Find all .rels files
         rels_files = list(self.unpacked_dir.rglob("*.rels"))
 
@@ -314,19 +463,53 @@ class BaseSchemaValidator:
             ):  # This file is not referenced by .rels
                 all_files.append(file_path.resolve())
 
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
-
         if self.verbose:
             print(
                 f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
             )
 
+        # Results only change when a file is added or removed or a .rels file changes
+        key = (
+            tuple(sorted(all_files)),
+            tuple((str(f), self._file_digest(f)) for f in sorted(rels_files)),
+        )
+        errors = self._cached_check(
+            "file_references",
+            key,
+            lambda: self._find_reference_errors(rels_files, all_files),
+        )
+
+        self.result.add_errors(errors)
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} relationship validation errors:")
+            for error in errors:
+                print(error)
+            print(
+                "CRITICAL: These errors will cause the document to appear corrupt. "
+                + "Broken references MUST be fixed, "
+                + "and unreferenced files MUST be referenced or removed."
+            )
+            return False
+        else:
+            if self.verbose:
+                print(
+                    "PASSED - All references are valid and all files are properly referenced"
+                )
+            return True
+
+    def _find_reference_errors(self, rels_files, all_files):
+        """Return broken-reference and unreferenced-file errors for validate_file_references."""
+        errors = []
+
+        # Track all files that are referenced by any .rels file
+        all_referenced_files = set()
+
         # Check each .rels file
         for rels_file in rels_files:
             try:
                 # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -365,128 +548,48 @@ class BaseSchemaValidator:
                             broken_refs.append((target, rel.sourceline))
 
                 # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
+                for broken_ref, line_num in broken_refs:
+                    errors.append(
+                        ValidationError(
+                            "broken_reference",
+                            f"Broken reference to {broken_ref}",
+                            file=self._part_name(rels_file),
+                            line=line_num,
                         )
+                    )
 
             except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                errors.append(
+                    ValidationError(
+                        "part_error",
+                        f"Error parsing: {e}",
+                        file=self._part_name(rels_file),
+                    )
+                )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
         unreferenced_files = set(all_files) - all_referenced_files
 
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} relationship validation errors:")
-            for error in errors:
-                print(error)
-            print(
-                "CRITICAL: These errors will cause the document to appear corrupt. "
-                + "Broken references MUST be fixed, "
-                + "and unreferenced files MUST be referenced or removed."
-            )
-            return False
-        else:
-            if self.verbose:
-                print(
-                    "PASSED - All references are valid and all files are properly referenced"
+        for unref_file in sorted(unreferenced_files):
+            errors.append(
+                ValidationError(
+                    "unreferenced_file",
+                    "Unreferenced file",
+                    file=self._part_name(unref_file),
                 )
-            return True
+            )
+
+        return errors
 
+    @validation_check("relationship_ids")
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
+        errors = self._rule_errors(RelationshipIdRule)
 
-        errors = []
-
-        # Process each XML file that might contain r:id references
-        for xml_file in self.xml_files:
-            # Skip .rels files themselves
-            if xml_file.suffix == ".rels":
-                continue
-
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
-
-            # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
-                continue
-
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+        self.result.add_errors(errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
@@ -535,19 +638,56 @@ class BaseSchemaValidator:
 
         return None
 
+    @validation_check("content_types")
     def validate_content_types(self):
         """Validate that all content files are properly declared in [Content_Types].xml."""
-        errors = []
-
         # Find [Content_Types].xml file
         content_types_file = self.unpacked_dir / "[Content_Types].xml"
         if not content_types_file.exists():
+            self.result.add_errors(
+                [
+                    ValidationError(
+                        "missing_content_types",
+                        "File not found",
+                        file="[Content_Types].xml",
+                    )
+                ]
+            )
             print("FAILED - [Content_Types].xml file not found")
             return False
 
+        # Results only change when a file is added or removed or an XML part changes
+        key = (
+            tuple(sorted(str(f) for f in self.unpacked_dir.rglob("*") if f.is_file())),
+            tuple((str(f), self._file_digest(f)) for f in self.xml_files),
+        )
+        errors = self._cached_check(
+            "content_types",
+            key,
+            lambda: self._find_content_type_errors(content_types_file),
+        )
+
+        self.result.add_errors(errors)
+
+        if errors:
+            print(f"FAILED - Found {len(errors)} content type declaration errors:")
+            for error in errors:
+                print(error)
+            return False
+        else:
+            if self.verbose:
+                print(
+                    "PASSED - All content files are properly declared in [Content_Types].xml"
+                )
+            return True
+
+    def _find_content_type_errors(self, content_types_file):
+        """Return undeclared-part and undeclared-extension errors for validate_content_types."""
+        errors = []
+
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -609,12 +749,16 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
+                    root_tag = self._get_root_tag(xml_file)
                     root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
 
                     if root_name in declarable_roots and path_str not in declared_parts:
                         errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                            ValidationError(
+                                "undeclared_part",
+                                f"File with <{root_name}> root not declared in [Content_Types].xml",
+                                file=path_str,
+                            )
                         )
 
                 except Exception:
@@ -634,25 +778,30 @@ class BaseSchemaValidator:
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
                     if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
                         errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                            ValidationError(
+                                "undeclared_extension",
+                                f'File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>',
+                                file=self._part_name(file_path),
+                            )
                         )
 
         except Exception as e:
-            errors.append(f"  Error parsing [Content_Types].xml: {e}")
-
-        if errors:
-            print(f"FAILED - Found {len(errors)} content type declaration errors:")
-            for error in errors:
-                print(error)
-            return False
-        else:
-            if self.verbose:
-                print(
-                    "PASSED - All content files are properly declared in [Content_Types].xml"
+            errors.append(
+                ValidationError(
+                    "part_error", f"Error parsing: {e}", file="[Content_Types].xml"
                 )
-            return True
+            )
+
+        return errors
+
+    def _get_root_tag(self, xml_file):
+        """Return the tag of a part's root element."""
+        if self._is_streamed(xml_file):
+            # Stop reading after the root start tag
+            _, root = next(lxml.etree.iterparse(str(xml_file), events=("start",)))
+            return root.tag
+        return self._parse_xml(xml_file).getroot().tag
 
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
@@ -701,6 +850,7 @@ class BaseSchemaValidator:
                 )
             return True, set()
 
+    @validation_check("xsd")
     def validate_against_xsd(self):
         """Validate XML files against XSD schemas, showing only new errors compared to original."""
         new_errors = []
@@ -708,11 +858,31 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
+        # Only validate parts that changed (or whose original changed) since
+        # their last validation
+        self._load_original()
+        stale = []
         for xml_file in self.xml_files:
-            relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
+            digest = (self._file_digest(xml_file), self._original_key)
+            cached = self._xsd_results.get(xml_file)
+            if cached is None or cached[0] != digest:
+                stale.append((xml_file, digest))
+        stale_files = [xml_file for xml_file, _ in stale]
+
+        if self.workers and self.workers > 1 and len(stale_files) > 1:
+            results = self._validate_files_against_xsd_parallel(stale_files)
+        else:
+            results = (
+                self.validate_file_against_xsd(xml_file, verbose=False)
+                for xml_file in stale_files
             )
+        for (xml_file, digest), result in zip(stale, results):
+            self._xsd_results[xml_file] = (digest, result)
+
+        # Report in self.xml_files order, so the output is stable
+        for xml_file in self.xml_files:
+            is_valid, new_file_errors = self._xsd_results[xml_file][1]
+            relative_path = str(xml_file.relative_to(self.unpacked_dir))
 
             if is_valid is None:
                 skipped_count += 1
@@ -727,12 +897,26 @@ class BaseSchemaValidator:
                 continue
 
             # Has new errors
+            self.result.add_errors(
+                ValidationError("xsd", error, file=Path(relative_path).as_posix())
+                for error in sorted(new_file_errors)
+            )
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
+        files_with_new_errors = len([e for e in new_errors if not e.startswith("    ")])
+        self.result.stats["xsd"] = {
+            "files": len(self.xml_files),
+            "revalidated": len(stale_files),
+            "valid": valid_count,
+            "skipped": skipped_count,
+            "with_original_errors": original_error_count,
+            "with_new_errors": files_with_new_errors,
+        }
+
         # Print summary
         if self.verbose:
             print(f"Validated {len(self.xml_files)} files:")
@@ -740,9 +924,7 @@ class BaseSchemaValidator:
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
                 print(f"  - With original errors (ignored): {original_error_count}")
-            print(
-                f"  - With NEW errors: {len(new_errors) > 0 and len([e for e in new_errors if not e.startswith('    ')]) or 0}"
-            )
+            print(f"  - With NEW errors: {files_with_new_errors}")
 
         if new_errors:
             print("\nFAILED - Found NEW validation errors:")
@@ -754,6 +936,32 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _validate_files_against_xsd_parallel(self, xml_files):
+        """Run validate_file_against_xsd for the given files in a process pool.
+
+        Each worker builds its own validator, so it keeps its own schema pool,
+        parse cache and original-part cache. Results are returned in the same
+        order as xml_files.
+        """
+        chunksize = max(1, len(xml_files) // (self.workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_xsd_worker,
+            initargs=(
+                type(self),
+                str(self.unpacked_dir),
+                self.original_file and str(self.original_file),
+                self.streaming,
+            ),
+        ) as executor:
+            return list(
+                executor.map(
+                    _validate_file_in_worker,
+                    [str(xml_file) for xml_file in xml_files],
+                    chunksize=chunksize,
+                )
+            )
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -778,11 +986,15 @@ class BaseSchemaValidator:
 
         return None
 
-    def _clean_ignorable_namespaces(self, xml_doc):
-        """Remove attributes and elements not in allowed namespaces."""
-        # Create a clean copy
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+    def _clean_ignorable_namespaces(self, xml_doc, in_place=False):
+        """Remove attributes and elements not in allowed namespaces.
+
+        Works on a copy of xml_doc unless in_place is True.
+        """
+        if in_place:
+            xml_copy = xml_doc.getroot()
+        else:
+            xml_copy = copy.deepcopy(xml_doc.getroot())
 
         # Remove attributes not in allowed namespaces
         for elem in xml_copy.iter():
@@ -846,28 +1058,44 @@ class BaseSchemaValidator:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            xml_doc = self._parse_xml(xml_file)
+        except Exception as e:
+            return False, {str(e)}
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+        # Streamed parts are parsed just for this check and can be modified
+        return self._validate_xml_doc_xsd(
+            xml_doc,
+            schema_path,
+            xml_file.relative_to(base_path),
+            in_place=self._is_streamed(xml_file),
+        )
+
+    def _validate_xml_doc_xsd(
+        self, xml_doc, schema_path, relative_path, in_place=False
+    ):
+        """Validate a parsed XML document against XSD schema. Returns (is_valid, errors_set).
 
-            xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
+        Preprocessing works on a single copy of xml_doc, or modifies xml_doc
+        itself if in_place is True (for trees that aren't shared).
+        """
+        try:
+            # Load schema (compiled once per process)
+            schema = self.load_schema(schema_path)
+
+            # Preprocess XML
+            if not in_place:
+                xml_doc = lxml.etree.ElementTree(copy.deepcopy(xml_doc.getroot()))
+            xml_doc, _ = self._remove_template_tags_from_text_nodes(
+                xml_doc, in_place=True
+            )
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
 
             # Clean ignorable namespaces if needed
-            relative_path = xml_file.relative_to(base_path)
             if (
                 relative_path.parts
                 and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
             ):
-                xml_doc = self._clean_ignorable_namespaces(xml_doc)
+                xml_doc = self._clean_ignorable_namespaces(xml_doc, in_place=True)
 
             # Validate
             if schema.validate(xml_doc):
@@ -882,49 +1110,163 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    @staticmethod
+    def load_schema(schema_path):
+        """Return the compiled XMLSchema for schema_path from the process-wide pool.
+
+        The schema is parsed and compiled on first use only; later calls from
+        any validator instance return the same object. Schemas that fail to
+        compile are remembered too, and raise the same error on every call.
+        """
+        key = str(Path(schema_path).resolve())
+        schema = _SCHEMA_POOL.get(key)
+        if schema is None:
+            with _SCHEMA_POOL_LOCK:
+                schema = _SCHEMA_POOL.get(key)
+                if schema is None:
+                    try:
+                        with open(key, "rb") as xsd_file:
+                            parser = lxml.etree.XMLParser()
+                            xsd_doc = lxml.etree.parse(
+                                xsd_file, parser=parser, base_url=key
+                            )
+                            schema = lxml.etree.XMLSchema(xsd_doc)
+                    except lxml.etree.LxmlError as e:
+                        schema = e
+                    _SCHEMA_POOL[key] = schema
+
+        if isinstance(schema, Exception):
+            raise schema
+        return schema
+
+    @classmethod
+    def warm_up_schemas(cls):
+        """Compile every schema in SCHEMA_MAPPINGS ahead of time.
+
+        Optional; long-running workers can call this at startup so that the
+        first validation does not pay the schema compile cost.
+
+        Returns:
+            int: Number of schemas compiled successfully
+        """
+        compiled = 0
+        for schema_name in sorted(set(cls.SCHEMA_MAPPINGS.values())):
+            try:
+                cls.load_schema(cls.SCHEMAS_DIR / schema_name)
+                compiled += 1
+            except lxml.etree.LxmlError:
+                # Reported per file when the schema is actually used
+                continue
+        return compiled
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        Results are memoized per part, and the original package is read only
+        once per version of it (see _load_original).
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
+        part_name = relative_path.as_posix()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        self._load_original()
+        if part_name not in self._original_errors:
+            errors = set()
+            content = self._read_original_part(part_name)
+            schema_path = self._get_schema_path(relative_path)
 
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+            # A part that didn't exist in the original has no original errors
+            if content is not None and schema_path:
+                try:
+                    xml_doc = lxml.etree.ElementTree(lxml.etree.fromstring(content))
+                    _, errors = self._validate_xml_doc_xsd(
+                        xml_doc, schema_path, relative_path, in_place=True
+                    )
+                except Exception as e:
+                    errors = {str(e)}
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+            self._original_errors[part_name] = errors
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
+        return self._original_errors[part_name]
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+    def _read_original_part(self, part_name):
+        """Return the raw bytes of an XML part in the original package.
+
+        The original package is read once per version of it (see
+        _load_original); later calls are lookups. In streaming mode, members larger than
+        STREAMING_THRESHOLD are not kept and are read from the zip each time
+        they are requested.
 
-    def _remove_template_tags_from_text_nodes(self, xml_doc):
+        Args:
+            part_name: Zip member name, e.g. "word/document.xml"
+
+        Returns:
+            bytes: Part content, or None if the part is not in the original
+        """
+        self._load_original()
+        content = self._original_parts.get(part_name)
+        if content is None and part_name in self._original_parts:
+            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
+                content = zip_ref.read(part_name)
+        return content
+
+    def _load_original(self):
+        """Read every .xml and .rels member of the original file.
+
+        The file is read again only when its mtime or size changes. Parts and
+        their memoized XSD errors are shared with other validators in this
+        process that use the same (unchanged) original file, so that
+        validating many documents generated from one template reads and
+        checks the template only once.
+        """
+        if self.original_file is None:
+            if self._original_parts is None:
+                self._original_parts, self._original_errors = {}, {}
+            return
+
+        path = self.original_file.resolve()
+        stat = path.stat()
+        key = (type(self), str(path), stat.st_mtime_ns, stat.st_size, self.streaming)
+        if key == self._original_key:
+            return
+
+        with _ORIGINAL_POOL_LOCK:
+            cached = _ORIGINAL_POOL.get(key)
+            if cached is not None:
+                _ORIGINAL_POOL.move_to_end(key)
+        if cached is None:
+            parts = {}
+            with zipfile.ZipFile(path, "r") as zip_ref:
+                for info in zip_ref.infolist():
+                    if not info.filename.endswith((".xml", ".rels")):
+                        continue
+                    if self.streaming and info.file_size > self.STREAMING_THRESHOLD:
+                        parts[info.filename] = None  # Read on demand
+                    else:
+                        parts[info.filename] = zip_ref.read(info)
+            with _ORIGINAL_POOL_LOCK:
+                cached = _ORIGINAL_POOL.setdefault(key, (parts, {}))
+                while len(_ORIGINAL_POOL) > _ORIGINAL_POOL_SIZE:
+                    _ORIGINAL_POOL.popitem(last=False)
+
+        self._original_parts, self._original_errors = cached
+        self._original_key = key
+
+    def _remove_template_tags_from_text_nodes(self, xml_doc, in_place=False):
         """Remove template tags from XML text nodes and collect warnings.
 
         Template tags follow the pattern {{ ... }} and are used as placeholders
         for content replacement. They should be removed from text content before
-        XSD validation while preserving XML structure.
+        XSD validation while preserving XML structure. Works on a copy of
+        xml_doc unless in_place is True.
 
         Returns:
             tuple: (cleaned_xml_doc, warnings_list)
@@ -933,8 +1275,10 @@ class BaseSchemaValidator:
         template_pattern = re.compile(r"\{\{[^}]*\}\}")
 
         # Create a copy of the document to avoid modifying the original
-        xml_string = lxml.etree.tostring(xml_doc, encoding="unicode")
-        xml_copy = lxml.etree.fromstring(xml_string)
+        if in_place:
+            xml_copy = xml_doc.getroot()
+        else:
+            xml_copy = copy.deepcopy(xml_doc.getroot())
 
         def process_text_content(text, content_type):
             if not text:
@@ -963,5 +1307,18 @@ class BaseSchemaValidator:
         return lxml.etree.ElementTree(xml_copy), warnings
 
 
+def _init_xsd_worker(validator_class, unpacked_dir, original_file, streaming):
+    """Process pool initializer: create the validator used by this worker."""
+    global _worker_validator
+    _worker_validator = validator_class(
+        unpacked_dir, original_file, streaming=streaming
+    )
+
+
+def _validate_file_in_worker(xml_file):
+    """Process pool task: XSD-validate one file. Returns (is_valid, new_errors_set)."""
+    return _worker_validator.validate_file_against_xsd(Path(xml_file), verbose=False)
+
+
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
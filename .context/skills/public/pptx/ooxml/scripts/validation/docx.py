@@ -2,13 +2,125 @@
 Validator for Word document XML files against XSD schemas.
 """
 
+import io
 import re
-import tempfile
-import zipfile
 
 import lxml.etree
 
 from .base import BaseSchemaValidator
+from .results import ValidationResult, validation_check
+from .rules import ValidationRule, iterparse_events
+
+
+def _text_preview(text):
+    """Return a repr of text, truncated for error messages."""
+    return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+
+
+class _DocumentXmlRule(ValidationRule):
+    """Base for rules that only check document.xml files."""
+
+    def applies_to(self, part):
+        return part.path.name == "document.xml"
+
+    def start_part(self, part):
+        self.part = part
+
+    def _w(self, name):
+        """Return the Clark-notation tag for a Word element."""
+        return f"{{{self.validator.WORD_2006_NAMESPACE}}}{name}"
+
+
+class WhitespacePreservationRule(_DocumentXmlRule):
+    """w:t elements with leading/trailing whitespace need xml:space='preserve'."""
+
+    def register(self, registry):
+        registry.on_start(self._w("t"), self._check_text)
+
+    def _check_text(self, elem):
+        text = elem.text
+        if not text:
+            return
+
+        # Check if text starts or ends with whitespace
+        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+            # Check if xml:space="preserve" attribute exists
+            xml_space_attr = f"{{{self.validator.XML_NAMESPACE}}}space"
+            if (
+                xml_space_attr not in elem.attrib
+                or elem.attrib[xml_space_attr] != "preserve"
+            ):
+                self.report(
+                    "whitespace_not_preserved",
+                    self.part.relative_path,
+                    f"w:t element with whitespace missing xml:space='preserve': {_text_preview(text)}",
+                    line=elem.sourceline,
+                )
+
+
+class DeletionRule(_DocumentXmlRule):
+    """w:t elements must not appear within w:del elements."""
+
+    def register(self, registry):
+        registry.on_start(self._w("del"), self._enter_del)
+        registry.on_end(self._w("del"), self._leave_del)
+        registry.on_start(self._w("t"), self._check_text)
+
+    def start_part(self, part):
+        super().start_part(part)
+        self.del_depth = 0
+
+    def _enter_del(self, elem):
+        self.del_depth += 1
+
+    def _leave_del(self, elem):
+        self.del_depth -= 1
+
+    def _check_text(self, elem):
+        if self.del_depth and elem.text:
+            self.report(
+                "text_in_deletion",
+                self.part.relative_path,
+                f"<w:t> found within <w:del>: {_text_preview(elem.text)}",
+                line=elem.sourceline,
+            )
+
+
+class InsertionRule(_DocumentXmlRule):
+    """w:delText must not appear within w:ins unless nested within a w:del."""
+
+    def register(self, registry):
+        registry.on_start(self._w("ins"), self._enter_ins)
+        registry.on_end(self._w("ins"), self._leave_ins)
+        registry.on_start(self._w("del"), self._enter_del)
+        registry.on_end(self._w("del"), self._leave_del)
+        registry.on_start(self._w("delText"), self._check_del_text)
+
+    def start_part(self, part):
+        super().start_part(part)
+        self.ins_depth = 0
+        self.del_depth = 0
+
+    def _enter_ins(self, elem):
+        self.ins_depth += 1
+
+    def _leave_ins(self, elem):
+        self.ins_depth -= 1
+
+    def _enter_del(self, elem):
+        self.del_depth += 1
+
+    def _leave_del(self, elem):
+        self.del_depth -= 1
+
+    def _check_del_text(self, elem):
+        if self.ins_depth and not self.del_depth:
+            self.report(
+                "deltext_in_insertion",
+                self.part.relative_path,
+                f"<w:delText> within <w:ins>: {_text_preview(elem.text or '')}",
+                line=elem.sourceline,
+            )
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -17,12 +129,26 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     # Word-specific namespace
     WORD_2006_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 
+    # Structural checks that run together in a single traversal per part
+    RULES = BaseSchemaValidator.RULES + [
+        WhitespacePreservationRule,
+        DeletionRule,
+        InsertionRule,
+    ]
+
     # Word-specific element to relationship type mappings
     # Start with empty mapping - add specific cases as we discover them
     ELEMENT_RELATIONSHIP_TYPES = {}
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._original_paragraph_count = None  # (original key, count)
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
+        self.result = ValidationResult(type(self).__name__)
+        self.refresh()
+
         # Test 0: XML well-formedness
         if not self.validate_xml():
             return False
@@ -69,47 +195,14 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    @validation_check("whitespace_preservation")
     def validate_whitespace_preservation(self):
         """
         Validate that w:t elements with whitespace have xml:space='preserve'.
         """
-        errors = []
+        errors = self._rule_errors(WhitespacePreservationRule)
 
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        self.result.add_errors(errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
@@ -121,44 +214,15 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All whitespace is properly preserved")
             return True
 
+    @validation_check("deletions")
     def validate_deletions(self):
         """
         Validate that w:t elements are not within w:del elements.
         For some reason, XSD validation does not catch this, so we do it manually.
         """
-        errors = []
-
-        for xml_file in self.xml_files:
-            # Only check document.xml files
-            if xml_file.name != "document.xml":
-                continue
+        errors = self._rule_errors(DeletionRule)
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        self.result.add_errors(errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
@@ -180,10 +244,13 @@ class DOCXSchemaValidator(BaseSchemaValidator):
                 continue
 
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+                if self._is_streamed(xml_file):
+                    count = self._count_paragraphs_streaming(str(xml_file))
+                else:
+                    root = self._parse_xml(xml_file).getroot()
+                    # Count all w:p elements
+                    paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
+                    count = len(paragraphs)
             except Exception as e:
                 print(f"Error counting paragraphs in unpacked document: {e}")
 
@@ -194,15 +261,22 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
+            # Read document.xml from the (cached) original package
+            content = self._read_original_part("word/document.xml")
+
+            # Count each version of the original only once
+            if (
+                self._original_paragraph_count is not None
+                and self._original_paragraph_count[0] == self._original_key
+            ):
+                return self._original_paragraph_count[1]
+
+            if content is None:
+                raise FileNotFoundError("word/document.xml not found")
+            if self.streaming and len(content) > self.STREAMING_THRESHOLD:
+                count = self._count_paragraphs_streaming(io.BytesIO(content))
+            else:
+                root = lxml.etree.fromstring(content)
 
                 # Count all w:p elements
                 paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
@@ -210,45 +284,29 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
+            return count
 
+        self._original_paragraph_count = (self._original_key, count)
         return count
 
+    def _count_paragraphs_streaming(self, source):
+        """Count w:p elements without building the whole tree."""
+        p_tag = f"{{{self.WORD_2006_NAMESPACE}}}p"
+        return sum(
+            1
+            for event, elem in iterparse_events(source)
+            if event == "end" and elem.tag == p_tag
+        )
+
+    @validation_check("insertions")
     def validate_insertions(self):
         """
         Validate that w:delText elements are not within w:ins elements.
         w:delText is only allowed in w:ins if nested within a w:del.
         """
-        errors = []
-
-        for xml_file in self.xml_files:
-            if xml_file.name != "document.xml":
-                continue
-
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
+        errors = self._rule_errors(InsertionRule)
 
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        self.result.add_errors(errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
@@ -262,9 +320,17 @@ class DOCXSchemaValidator(BaseSchemaValidator):
 
     def compare_paragraph_counts(self):
         """Compare paragraph counts between original and new document."""
+        if self.original_file is None:
+            return
+
         original_count = self.count_paragraphs_in_original()
         new_count = self.count_paragraphs_in_unpacked()
 
+        self.result.stats["paragraphs"] = {
+            "original": original_count,
+            "unpacked": new_count,
+        }
+
         diff = new_count - original_count
         diff_str = f"+{diff}" if diff > 0 else str(diff)
         print(f"\nParagraphs: {original_count} → {new_count} ({diff_str})")
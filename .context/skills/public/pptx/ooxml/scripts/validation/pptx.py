@@ -5,6 +5,38 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 import re
 
 from .base import BaseSchemaValidator
+from .results import ValidationError, ValidationResult, validation_check
+from .rules import ValidationRule
+
+# UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+UUID_PATTERN = re.compile(
+    r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+)
+
+
+class UuidIdRule(ValidationRule):
+    """ID attributes that look like UUIDs must contain only hex values."""
+
+    def register(self, registry):
+        registry.on_attribute(None, self._check_attribute)
+
+    def start_part(self, part):
+        self.part = part
+
+    def _check_attribute(self, elem, attr, value):
+        # Check if this is an ID attribute
+        attr_name = attr.split("}")[-1].lower()
+        if attr_name == "id" or attr_name.endswith("id"):
+            # Check if value looks like a UUID (has the right length and pattern structure)
+            if self.validator._looks_like_uuid(value):
+                # Validate that it contains only hex characters in the right positions
+                if not UUID_PATTERN.match(value):
+                    self.report(
+                        "invalid_uuid",
+                        self.part.relative_path,
+                        f"ID '{value}' appears to be a UUID but contains invalid hex characters",
+                        line=elem.sourceline,
+                    )
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
@@ -25,8 +57,14 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         "tablestyleid": "tablestyles",
     }
 
+    # Structural checks that run together in a single traversal per part
+    RULES = BaseSchemaValidator.RULES + [UuidIdRule]
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
+        self.result = ValidationResult(type(self).__name__)
+        self.refresh()
+
         # Test 0: XML well-formedness
         if not self.validate_xml():
             return False
@@ -74,39 +112,12 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
         return all_valid
 
+    @validation_check("uuid_ids")
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
-        errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
+        errors = self._rule_errors(UuidIdRule)
 
-        for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Check all elements for ID attributes
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        # Check if this is an ID attribute
-                        attr_name = attr.split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            # Check if value looks like a UUID (has the right length and pattern structure)
-                            if self._looks_like_uuid(value):
-                                # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+        self.result.add_errors(errors)
 
         if errors:
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
@@ -125,6 +136,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         # Check if it's 32 hex-like characters (could include invalid hex chars)
         return len(clean_value) == 32 and all(c.isalnum() for c in clean_value)
 
+    @validation_check("slide_layout_ids")
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
         import lxml.etree
@@ -142,20 +154,23 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._parse_xml(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
                 rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
 
                 if not rels_file.exists():
                     errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        ValidationError(
+                            "missing_rels_file",
+                            f"Missing relationships file: {self._part_name(rels_file)}",
+                            file=self._part_name(slide_master),
+                        )
                     )
                     continue
 
                 # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
@@ -177,16 +192,24 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                     if r_id and r_id not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
+                            ValidationError(
+                                "missing_slide_layout",
+                                f"sldLayoutId with id='{layout_id}' "
+                                f"references r:id='{r_id}' which is not found in slide layout relationships",
+                                file=self._part_name(slide_master),
+                                line=sld_layout_id.sourceline,
+                            )
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
+                    ValidationError(
+                        "part_error", f"Error: {e}", file=self._part_name(slide_master)
+                    )
                 )
 
+        self.result.add_errors(errors)
+
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
             for error in errors:
@@ -200,16 +223,15 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slide layout IDs reference valid slide layouts")
             return True
 
+    @validation_check("duplicate_slide_layouts")
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
         slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all slideLayout relationships
                 layout_rels = [
@@ -222,14 +244,22 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                 if len(layout_rels) > 1:
                     errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                        ValidationError(
+                            "duplicate_slide_layout",
+                            f"has {len(layout_rels)} slideLayout references",
+                            file=self._part_name(rels_file),
+                        )
                     )
 
             except Exception as e:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    ValidationError(
+                        "part_error", f"Error: {e}", file=self._part_name(rels_file)
+                    )
                 )
 
+        self.result.add_errors(errors)
+
         if errors:
             print("FAILED - Found slides with duplicate slideLayout references:")
             for error in errors:
@@ -240,6 +270,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slides have exactly one slideLayout reference")
             return True
 
+    @validation_check("notes_slide_references")
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
         import lxml.etree
@@ -258,7 +289,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for rels_file in slide_rels_files:
             try:
                 # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse_xml(rels_file).getroot()
 
                 # Find all notesSlide relationships
                 for rel in root.findall(
@@ -284,7 +315,9 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    ValidationError(
+                        "part_error", f"Error: {e}", file=self._part_name(rels_file)
+                    )
                 )
 
         # Check for duplicate references
@@ -292,14 +325,25 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             if len(references) > 1:
                 slide_names = [ref[0] for ref in references]
                 errors.append(
-                    f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
+                    ValidationError(
+                        "shared_notes_slide",
+                        f"Notes slide is referenced by multiple slides: {', '.join(slide_names)}",
+                        file=(
+                            target.lstrip("/")
+                            if target.startswith("/")
+                            else f"ppt/{target}"
+                        ),
+                        details=[
+                            self._part_name(rels_file) for _, rels_file in references
+                        ],
+                    )
                 )
-                for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
+
+        self.result.add_errors(errors)
 
         if errors:
             print(
-                f"FAILED - Found {len([e for e in errors if not e.startswith('    ')])} notes slide reference validation errors:"
+                f"FAILED - Found {len(errors)} notes slide reference validation errors:"
             )
             for error in errors:
                 print(error)
@@ -0,0 +1,168 @@
+"""
+Structured validation results.
+
+Validators still print their findings and return a bool from each check, but
+they also record every check they run in a ValidationResult: whether it
+passed, how long it took and the individual errors it found. Batch jobs can
+read validator.result (or the JSON written by validate.py --json) instead of
+parsing the printed output.
+"""
+
+import functools
+import json
+import time
+
+
+class ValidationError:
+    """A single problem found by a check.
+
+    Checks build these records directly; the line printed for an error is
+    rendered from the record by str().
+    """
+
+    def __init__(self, rule, message, file=None, line=None, details=()):
+        self.rule = rule  # Name of the rule that was violated
+        self.message = message
+        self.file = file  # Part path relative to the unpacked dir, if known
+        self.line = line  # Line number in the part, if known
+        self.details = list(details)  # Extra lines, e.g. the parts involved
+
+    def __str__(self):
+        """Return the error as printed, e.g. "  word/document.xml: Line 3: ..."."""
+        text = "  "
+        if self.file is not None:
+            text += f"{self.file}: "
+        if self.line is not None:
+            text += f"Line {self.line}: "
+        text += self.message
+        return "\n".join([text] + [f"    - {detail}" for detail in self.details])
+
+    def to_dict(self):
+        return {
+            "file": self.file,
+            "line": self.line,
+            "rule": self.rule,
+            "message": self.message,
+            "details": self.details,
+        }
+
+
+class CheckResult:
+    """Outcome of one validation check."""
+
+    def __init__(self, name):
+        self.name = name
+        self.passed = None  # True/False once the check has finished
+        self.duration = 0.0  # Wall time in seconds
+        self.errors = []  # ValidationError records
+        self._started = time.perf_counter()
+
+    def add_errors(self, errors):
+        """Record ValidationError records found by this check."""
+        self.errors.extend(errors)
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "duration": round(self.duration, 6),
+            "error_count": len(self.errors),
+            "errors": [error.to_dict() for error in self.errors],
+        }
+
+
+class ValidationResult:
+    """All checks run by one validator, in the order they ran."""
+
+    def __init__(self, validator=None):
+        self.validator = validator  # Name of the validator class
+        self.checks = []  # CheckResult objects
+        self.stats = {}  # Extra figures reported by a validator (e.g. paragraph counts)
+        self._running = []  # Checks in progress, innermost last
+
+    @property
+    def passed(self):
+        """True if no check failed."""
+        return all(check.passed is not False for check in self.checks)
+
+    @property
+    def errors(self):
+        """All error records, in check order."""
+        return [error for check in self.checks for error in check.errors]
+
+    @property
+    def error_counts(self):
+        """Number of errors per check name (failed checks only)."""
+        return {check.name: len(check.errors) for check in self.checks if check.errors}
+
+    @property
+    def duration(self):
+        """Total wall time of all checks, in seconds."""
+        return sum(check.duration for check in self.checks)
+
+    def start_check(self, name):
+        """Start timing a check and return its CheckResult."""
+        check = CheckResult(name)
+        self._running.append(check)
+        return check
+
+    def finish_check(self, check, passed):
+        """Stop timing a check and add it to the results."""
+        check.duration = time.perf_counter() - check._started
+        check.passed = bool(passed)
+        self._running.remove(check)
+        self.checks.append(check)
+
+    def add_errors(self, errors):
+        """Record ValidationError records for the check that is currently running.
+
+        Errors reported outside of a check are filed under a "general" check.
+        """
+        if self._running:
+            self._running[-1].add_errors(errors)
+            return
+        check = CheckResult("general")
+        check.add_errors(errors)
+        check.passed = not check.errors
+        self.checks.append(check)
+
+    def to_dict(self):
+        return {
+            "validator": self.validator,
+            "passed": self.passed,
+            "duration": round(self.duration, 6),
+            "error_count": len(self.errors),
+            "error_counts": self.error_counts,
+            "stats": self.stats,
+            "checks": [check.to_dict() for check in self.checks],
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+def validation_check(name):
+    """Decorator for validator methods that run one check and return a bool.
+
+    The check is timed and recorded in self.result under the given name,
+    together with any errors the method passes to self.result.add_errors().
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            check = self.result.start_check(name)
+            passed = False
+            try:
+                passed = method(self, *args, **kwargs)
+            finally:
+                self.result.finish_check(check, passed)
+            return passed
+
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
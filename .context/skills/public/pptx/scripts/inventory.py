@@ -16,20 +16,26 @@ Classes:
 
 Main Functions:
     extract_text_inventory: Extract all text from a presentation
+    get_inventory_as_dict: Extract all text as dictionaries, optionally in parallel
     save_inventory: Save extracted data to JSON
 
 Usage:
-    python inventory.py input.pptx output.json
+    python inventory.py input.pptx output.json [--jobs N]
 """
 
 import argparse
+import collections
+import concurrent.futures
+import functools
 import json
+import os
 import platform
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from overlaps import find_overlaps
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
 from pptx.enum.text import PP_ALIGN
@@ -46,6 +52,21 @@ InventoryData = Dict[
 ]  # Dict of slide_id -> {shape_id -> ShapeData}
 InventoryDict = Dict[str, Dict[str, ShapeDict]]  # JSON-serializable inventory
 
+# Font directories (searched in this order) and font file extensions by platform
+if platform.system() == "Darwin":  # macOS
+    FONT_DIRS = ["/System/Library/Fonts/", "/Library/Fonts/", "~/Library/Fonts/"]
+    FONT_EXTENSIONS = [".ttf", ".otf", ".ttc", ".dfont"]
+else:  # Linux
+    FONT_DIRS = ["/usr/share/fonts/truetype/", "/usr/local/share/fonts/", "~/.fonts/"]
+    FONT_EXTENSIONS = [".ttf", ".otf"]
+
+# Number of (font file, size) combinations whose fonts (load_font) and word
+# widths (TextMeasurer) are kept
+FONT_CACHE_SIZE = 128
+
+_font_index: Optional["FontIndex"] = None
+_text_measurer: Optional["TextMeasurer"] = None
+
 
 def main():
     """Main entry point for command-line usage."""
@@ -60,6 +81,9 @@ Examples:
   python inventory.py presentation.pptx inventory.json --issues-only
     Extracts only text shapes that have overflow or overlap issues
 
+  python inventory.py presentation.pptx inventory.json --jobs 4
+    Processes the slides in 4 worker processes
+
 The output JSON includes:
   - All text content organized by slide and shape
   - Correct absolute positions for shapes in groups
@@ -76,6 +100,13 @@ The output JSON includes:
         action="store_true",
         help="Include only text shapes that have overflow or overlap issues",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes to split the slides between (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -94,7 +125,12 @@ The output JSON includes:
             print(
                 "Filtering to include only text shapes with issues (overflow/overlap)"
             )
-        inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
+        if args.jobs > 1:
+            inventory = get_inventory_as_dict(
+                input_path, issues_only=args.issues_only, workers=args.jobs
+            )
+        else:
+            inventory = extract_text_inventory(input_path, issues_only=args.issues_only)
 
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -125,6 +161,284 @@ The output JSON includes:
         sys.exit(1)
 
 
+class FontIndex:
+    """Font files in a list of font directories, indexed by file name.
+
+    The directories are scanned once, including subdirectories, and each
+    font name is resolved once. A name resolves to the first directory
+    (in the given order) with a file named after it, e.g. "Arial.ttf",
+    "arial.ttf", "OpenSans.ttf" or "Open-Sans.ttf" for "Open Sans". Failing
+    that, it resolves to a font file whose name contains the font name
+    without spaces, ignoring case.
+    """
+
+    def __init__(self, font_dirs: List[str], extensions: List[str]):
+        self.extensions = [ext.lower() for ext in extensions]
+        # Per directory, in search order: ({file name: path}, [(lowercase name, path)])
+        self._dirs: List[Tuple[Dict[str, str], List[Tuple[str, str]]]] = []
+        for font_dir in font_dirs:
+            by_name: Dict[str, str] = {}
+            files: List[Tuple[str, str]] = []
+            for root, dirs, names in os.walk(Path(font_dir).expanduser()):
+                dirs.sort()
+                for name in sorted(names):
+                    if name.lower().endswith(tuple(self.extensions)):
+                        path = os.path.join(root, name)
+                        by_name.setdefault(name, path)
+                        files.append((name.lower(), path))
+            self._dirs.append((by_name, files))
+        self._resolved: Dict[str, Optional[str]] = {}
+
+    def find(self, font_name: str) -> Optional[str]:
+        """Return the path of the font file for font_name, or None if not found."""
+        if font_name not in self._resolved:
+            self._resolved[font_name] = self._resolve(font_name)
+        return self._resolved[font_name]
+
+    def _resolve(self, font_name: str) -> Optional[str]:
+        # Common font file variations to try
+        font_variations = [
+            font_name,
+            font_name.lower(),
+            font_name.replace(" ", ""),
+            font_name.replace(" ", "-"),
+        ]
+        font_name_lower = font_name.lower().replace(" ", "")
+
+        for by_name, files in self._dirs:
+            # First try exact matches
+            for variant in font_variations:
+                for ext in self.extensions:
+                    if f"{variant}{ext}" in by_name:
+                        return by_name[f"{variant}{ext}"]
+
+            # Then try fuzzy matching - find files containing the font name
+            for file_name_lower, path in files:
+                if font_name_lower in file_name_lower:
+                    return path
+
+        return None
+
+
+def get_font_index() -> FontIndex:
+    """Return the process-wide index of the system font directories."""
+    global _font_index
+    if _font_index is None:
+        _font_index = FontIndex(FONT_DIRS, FONT_EXTENSIONS)
+    return _font_index
+
+
+@functools.lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font(font_path: Optional[str], size: int) -> Any:
+    """Load a font file at a size, falling back to PIL's default font.
+
+    Loaded fonts are cached, so each (font file, size) is read only once.
+    """
+    if font_path:
+        try:
+            return ImageFont.truetype(font_path, size=size)
+        except Exception:
+            pass
+    return ImageFont.load_default()
+
+
+class TextMeasurer:
+    """Measures and wraps text with one shared PIL drawing context.
+
+    Word widths are cached per (font file, size), so each distinct word is
+    measured once per font and size; like load_font, only the
+    FONT_CACHE_SIZE most recently used fonts keep their widths. wrap() finds
+    line breaks from the cumulative widths of the words and measures each
+    resulting line only to confirm it, which keeps wrapping linear in the
+    length of the text.
+    """
+
+    def __init__(self):
+        self._draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+        # (font_path, size) -> {word: width}, least recently used first
+        self._word_widths = collections.OrderedDict()
+
+    def measure(self, text: str, font) -> float:
+        """Return the width of text in pixels."""
+        return self._draw.textlength(text, font=font)
+
+    def _widths_for(self, font_path: Optional[str], size: int) -> Dict[str, float]:
+        """Return the cached word widths for a font file and size."""
+        key = (font_path, size)
+        widths = self._word_widths.get(key)
+        if widths is None:
+            widths = self._word_widths[key] = {}
+            if len(self._word_widths) > FONT_CACHE_SIZE:
+                self._word_widths.popitem(last=False)
+        else:
+            self._word_widths.move_to_end(key)
+        return widths
+
+    def wrap(
+        self, line: str, max_width_px: int, font_path: Optional[str], size: int
+    ) -> List[str]:
+        """Wrap a single line of text at spaces to fit within max_width_px.
+
+        The text is measured in the font loaded by load_font(font_path, size).
+        Lines are filled greedily; a word wider than max_width_px gets a
+        line of its own.
+        """
+        if not line:
+            return [""]
+
+        font = load_font(font_path, size)
+        if self.measure(line, font) <= max_width_px:
+            return [line]
+
+        # Need to wrap - split into words
+        words = line.split(" ")
+        cache = self._widths_for(font_path, size)
+        for word in {*words, " "} - cache.keys():
+            cache[word] = self.measure(word, font)
+        widths = [cache[word] for word in words]
+        space_width = cache[" "]
+
+        wrapped = []
+        start = 0
+        while start < len(words):
+            # Estimate how many words fit from their cumulative width...
+            count = 0
+            width = 0.0
+            for index in range(start, len(words)):
+                width += widths[index] + (space_width if count else 0)
+                if width > max_width_px:
+                    break
+                count += 1
+
+            # ...then confirm by measuring the line, as kerning may differ
+            while count > 0 and not self._fits(words, start, count, max_width_px, font):
+                count -= 1
+            while start + count < len(words) and self._fits(
+                words, start, count + 1, max_width_px, font
+            ):
+                count += 1
+
+            count = max(count, 1)
+            text = _join_words(words[start : start + count])
+            if text:
+                wrapped.append(text)
+            start += count
+
+        return wrapped
+
+    def _fits(self, words: List[str], start: int, count: int, max_width_px, font):
+        text = _join_words(words[start : start + count])
+        return self.measure(text, font) <= max_width_px
+
+
+def _join_words(words: List[str]) -> str:
+    """Join words with spaces, ignoring leading empty words (from repeated spaces)."""
+    for index, word in enumerate(words):
+        if word:
+            return " ".join(words[index:])
+    return ""
+
+
+def get_text_measurer() -> TextMeasurer:
+    """Return the process-wide TextMeasurer."""
+    global _text_measurer
+    if _text_measurer is None:
+        _text_measurer = TextMeasurer()
+    return _text_measurer
+
+
+class StyleResolver:
+    """Per-presentation cache of the style defaults that shapes inherit.
+
+    Slide dimensions are read once, and each slide layout and slide master is
+    walked once for its default font sizes (by placeholder type and by text
+    style respectively), so shapes sharing a layout or master don't walk the
+    same XML again.
+    """
+
+    # Font size used when a master defines none
+    FALLBACK_FONT_SIZE = 14
+
+    def __init__(self, prs: Optional[Any] = None):
+        self.prs = prs
+        self._slide_dimensions: Optional[Tuple[Optional[int], Optional[int]]] = None
+        self._layout_sizes: Dict[Any, Dict[Any, Optional[float]]] = {}
+        self._master_sizes: Dict[Any, Dict[str, int]] = {}
+
+    def slide_dimensions(self, slide: Any) -> Tuple[Optional[int], Optional[int]]:
+        """Return (width_emu, height_emu) of the presentation's slides."""
+        if self._slide_dimensions is None:
+            if self.prs is not None:
+                self._slide_dimensions = (self.prs.slide_width, self.prs.slide_height)
+            else:
+                self._slide_dimensions = ShapeData.get_slide_dimensions(slide)
+        return self._slide_dimensions
+
+    def layout_font_size(
+        self, slide_layout: Any, placeholder_type: Any
+    ) -> Optional[float]:
+        """Return the default font size in points of a layout placeholder type.
+
+        Returns None if the layout has no such placeholder or it sets no size.
+        """
+        # Slide proxies aren't hashable, so layouts and masters are keyed by part
+        sizes = self._layout_sizes.get(slide_layout.part)
+        if sizes is None:
+            sizes = self._read_layout(slide_layout)
+            self._layout_sizes[slide_layout.part] = sizes
+        return sizes.get(placeholder_type)
+
+    def master_font_size(self, slide_master: Any, style_name: str) -> int:
+        """Return the default font size in points of a master text style.
+
+        Args:
+            slide_master: Slide master defining the text styles
+            style_name: "titleStyle" or "bodyStyle"
+        """
+        sizes = self._master_sizes.get(slide_master.part)
+        if sizes is None:
+            sizes = self._read_master(slide_master)
+            self._master_sizes[slide_master.part] = sizes
+        return sizes.get(style_name, self.FALLBACK_FONT_SIZE)
+
+    @staticmethod
+    def _read_layout(slide_layout: Any) -> Dict[Any, Optional[float]]:
+        """Map each placeholder type of a layout to its first defRPr size."""
+        sizes: Dict[Any, Optional[float]] = {}
+        try:
+            for layout_placeholder in slide_layout.placeholders:
+                placeholder_type = layout_placeholder.placeholder_format.type
+                if placeholder_type in sizes:
+                    continue
+                sizes[placeholder_type] = None
+                # Find first defRPr element with sz (size) attribute
+                for elem in layout_placeholder.element.iter():
+                    if "defRPr" in elem.tag and (sz := elem.get("sz")):
+                        sizes[placeholder_type] = float(sz) / 100.0
+                        break
+        except Exception:
+            pass
+        return sizes
+
+    def _read_master(self, slide_master: Any) -> Dict[str, int]:
+        """Map titleStyle and bodyStyle of a master to their first font size."""
+        sizes: Dict[str, int] = {}
+        if not hasattr(slide_master, "element"):
+            return sizes
+        for child in slide_master.element.iter():
+            tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
+            if tag not in ("titleStyle", "bodyStyle") or tag in sizes:
+                continue
+            for elem in child.iter():
+                if "sz" in elem.attrib:
+                    try:
+                        sizes[tag] = int(elem.attrib["sz"]) // 100
+                    except ValueError:
+                        sizes[tag] = self.FALLBACK_FONT_SIZE
+                    break
+        return sizes
+
+
 @dataclass
 class ShapeWithPosition:
     """A shape with its absolute position on the slide."""
@@ -280,67 +594,16 @@ class ShapeData:
     def get_font_path(font_name: str) -> Optional[str]:
         """Get the font file path for a given font name.
 
+        Looks the name up in the process-wide FontIndex, so the font
+        directories are scanned only once.
+
         Args:
             font_name: Name of the font (e.g., 'Arial', 'Calibri')
 
         Returns:
             Path to the font file, or None if not found
         """
-        system = platform.system()
-
-        # Common font file variations to try
-        font_variations = [
-            font_name,
-            font_name.lower(),
-            font_name.replace(" ", ""),
-            font_name.replace(" ", "-"),
-        ]
-
-        # Define font directories and extensions by platform
-        if system == "Darwin":  # macOS
-            font_dirs = [
-                "/System/Library/Fonts/",
-                "/Library/Fonts/",
-                "~/Library/Fonts/",
-            ]
-            extensions = [".ttf", ".otf", ".ttc", ".dfont"]
-        else:  # Linux
-            font_dirs = [
-                "/usr/share/fonts/truetype/",
-                "/usr/local/share/fonts/",
-                "~/.fonts/",
-            ]
-            extensions = [".ttf", ".otf"]
-
-        # Try to find the font file
-        from pathlib import Path
-
-        for font_dir in font_dirs:
-            font_dir_path = Path(font_dir).expanduser()
-            if not font_dir_path.exists():
-                continue
-
-            # First try exact matches
-            for variant in font_variations:
-                for ext in extensions:
-                    font_path = font_dir_path / f"{variant}{ext}"
-                    if font_path.exists():
-                        return str(font_path)
-
-            # Then try fuzzy matching - find files containing the font name
-            try:
-                for file_path in font_dir_path.iterdir():
-                    if file_path.is_file():
-                        file_name_lower = file_path.name.lower()
-                        font_name_lower = font_name.lower().replace(" ", "")
-                        if font_name_lower in file_name_lower and any(
-                            file_name_lower.endswith(ext) for ext in extensions
-                        ):
-                            return str(file_path)
-            except (OSError, PermissionError):
-                continue
-
-        return None
+        return get_font_index().find(font_name)
 
     @staticmethod
     def get_slide_dimensions(slide: Any) -> tuple[Optional[int], Optional[int]]:
@@ -391,6 +654,7 @@ class ShapeData:
         absolute_left: Optional[int] = None,
         absolute_top: Optional[int] = None,
         slide: Optional[Any] = None,
+        styles: Optional[StyleResolver] = None,
     ):
         """Initialize from a PowerPoint shape object.
 
@@ -399,13 +663,15 @@ class ShapeData:
             absolute_left: Absolute left position in EMUs (for shapes in groups)
             absolute_top: Absolute top position in EMUs (for shapes in groups)
             slide: Optional slide object to get dimensions and layout information
+            styles: Optional StyleResolver shared by the shapes of the presentation
         """
         self.shape = shape  # Store reference to original shape
         self.shape_id: str = ""  # Will be set after sorting
+        self.styles = styles if styles is not None else StyleResolver()
 
         # Get slide dimensions from slide object
         self.slide_width_emu, self.slide_height_emu = (
-            self.get_slide_dimensions(slide) if slide else (None, None)
+            self.styles.slide_dimensions(slide) if slide else (None, None)
         )
 
         # Get placeholder type if applicable
@@ -419,8 +685,8 @@ class ShapeData:
 
                 # Get default font size from layout
                 if slide and hasattr(slide, "slide_layout"):
-                    self.default_font_size = self.get_default_font_size(
-                        shape, slide.slide_layout
+                    self.default_font_size = self.styles.layout_font_size(
+                        slide.slide_layout, shape.placeholder_format.type  # type: ignore
                     )
 
         # Get position information
@@ -486,8 +752,6 @@ class ShapeData:
                 return 14
 
             slide_master = self.shape.part.slide_layout.slide_master  # type: ignore
-            if not hasattr(slide_master, "element"):
-                return 14
 
             # Determine theme style based on placeholder type
             style_name = "bodyStyle"  # Default
@@ -495,12 +759,7 @@ class ShapeData:
                 style_name = "titleStyle"
 
             # Find font size in theme styles
-            for child in slide_master.element.iter():
-                tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-                if tag == style_name:
-                    for elem in child.iter():
-                        if "sz" in elem.attrib:
-                            return int(elem.attrib["sz"]) // 100
+            return self.styles.master_font_size(slide_master, style_name)
         except Exception:
             pass
 
@@ -531,33 +790,11 @@ class ShapeData:
             self.inches_to_pixels(usable_height),
         )
 
-    def _wrap_text_line(self, line: str, max_width_px: int, draw, font) -> List[str]:
+    def _wrap_text_line(
+        self, line: str, max_width_px: int, font_path: Optional[str], font_size: int
+    ) -> List[str]:
         """Wrap a single line of text to fit within max_width_px."""
-        if not line:
-            return [""]
-
-        # Use textlength for efficient width calculation
-        if draw.textlength(line, font=font) <= max_width_px:
-            return [line]
-
-        # Need to wrap - split into words
-        wrapped = []
-        words = line.split(" ")
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            if draw.textlength(test_line, font=font) <= max_width_px:
-                current_line = test_line
-            else:
-                if current_line:
-                    wrapped.append(current_line)
-                current_line = word
-
-        if current_line:
-            wrapped.append(current_line)
-
-        return wrapped
+        return get_text_measurer().wrap(line, max_width_px, font_path, font_size)
 
     def _estimate_frame_overflow(self) -> None:
         """Estimate if text overflows the shape bounds using PIL text measurement."""
@@ -573,10 +810,6 @@ class ShapeData:
         if usable_width_px <= 0 or usable_height_px <= 0:
             return
 
-        # Set up PIL for text measurement
-        dummy_img = Image.new("RGB", (1, 1))
-        draw = ImageDraw.Draw(dummy_img)
-
         # Get default font size from placeholder or use conservative estimate
         default_font_size = self._get_default_font_size()
 
@@ -593,20 +826,14 @@ class ShapeData:
             font_name = para_data.font_name or "Arial"
             font_size = int(para_data.font_size or default_font_size)
 
-            font = None
             font_path = self.get_font_path(font_name)
-            if font_path:
-                try:
-                    font = ImageFont.truetype(font_path, size=font_size)
-                except Exception:
-                    font = ImageFont.load_default()
-            else:
-                font = ImageFont.load_default()
 
             # Wrap all lines in this paragraph
             all_wrapped_lines = []
             for line in paragraph.text.split("\n"):
-                wrapped = self._wrap_text_line(line, usable_width_px, draw, font)
+                wrapped = self._wrap_text_line(
+                    line, usable_width_px, font_path, font_size
+                )
                 all_wrapped_lines.extend(wrapped)
 
             if all_wrapped_lines:
@@ -888,27 +1115,23 @@ def detect_overlaps(shapes: List[ShapeData]) -> None:
     Args:
         shapes: List of ShapeData objects with shape_id attributes set
     """
-    n = len(shapes)
-
-    # Compare each pair of shapes
-    for i in range(n):
-        for j in range(i + 1, n):
-            shape1 = shapes[i]
-            shape2 = shapes[j]
-
-            # Ensure shape IDs are set
-            assert shape1.shape_id, f"Shape at index {i} has no shape_id"
-            assert shape2.shape_id, f"Shape at index {j} has no shape_id"
-
-            rect1 = (shape1.left, shape1.top, shape1.width, shape1.height)
-            rect2 = (shape2.left, shape2.top, shape2.width, shape2.height)
+    for i, shape in enumerate(shapes):
+        # Ensure shape IDs are set
+        assert shape.shape_id, f"Shape at index {i} has no shape_id"
 
-            overlaps, overlap_area = calculate_overlap(rect1, rect2)
+    # Same tolerance as calculate_overlap, without comparing every pair
+    boxes = [
+        (shape.left, shape.top, shape.left + shape.width, shape.top + shape.height)
+        for shape in shapes
+    ]
+    for i, j, overlap_width, overlap_height in find_overlaps(boxes, tolerance=0.05):
+        shape1 = shapes[i]
+        shape2 = shapes[j]
+        overlap_area = round(overlap_width * overlap_height, 2)
 
-            if overlaps:
-                # Add shape IDs with overlap area in square inches
-                shape1.overlapping_shapes[shape2.shape_id] = overlap_area
-                shape2.overlapping_shapes[shape1.shape_id] = overlap_area
+        # Add shape IDs with overlap area in square inches
+        shape1.overlapping_shapes[shape2.shape_id] = overlap_area
+        shape2.overlapping_shapes[shape1.shape_id] = overlap_area
 
 
 def extract_text_inventory(
@@ -925,69 +1148,126 @@ def extract_text_inventory(
     Shapes are sorted by visual position (top-to-bottom, left-to-right).
     The ShapeData objects contain the full shape information and can be
     converted to dictionaries for JSON serialization using to_dict().
+    To extract in several processes, use get_inventory_as_dict(workers=N).
     """
     if prs is None:
         prs = Presentation(str(pptx_path))
+    styles = StyleResolver(prs)
     inventory: InventoryData = {}
 
     for slide_idx, slide in enumerate(prs.slides):
-        # Collect all valid shapes from this slide with absolute positions
-        shapes_with_positions = []
-        for shape in slide.shapes:  # type: ignore
-            shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+        shapes = extract_slide_inventory(slide, styles, issues_only)
+        if shapes:
+            inventory[f"slide-{slide_idx}"] = shapes
 
-        if not shapes_with_positions:
-            continue
+    return inventory
 
-        # Convert to ShapeData with absolute positions and slide reference
-        shape_data_list = [
-            ShapeData(
-                swp.shape,
-                swp.absolute_left,
-                swp.absolute_top,
-                slide,
-            )
-            for swp in shapes_with_positions
-        ]
 
-        # Sort by visual position and assign stable IDs in one step
-        sorted_shapes = sort_shapes_by_position(shape_data_list)
-        for idx, shape_data in enumerate(sorted_shapes):
-            shape_data.shape_id = f"shape-{idx}"
+def extract_slide_inventory(
+    slide: Any, styles: Optional[StyleResolver] = None, issues_only: bool = False
+) -> Dict[str, ShapeData]:
+    """Extract the text shapes of one slide, keyed by their stable shape IDs.
 
-        # Detect overlaps using the stable shape IDs
-        if len(sorted_shapes) > 1:
-            detect_overlaps(sorted_shapes)
+    Args:
+        slide: Slide to extract
+        styles: StyleResolver of the slide's presentation
+        issues_only: If True, only include shapes that have overflow or overlap issues
 
-        # Filter for issues only if requested (after overlap detection)
-        if issues_only:
-            sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+    Returns an empty dictionary if the slide has no (matching) text shapes.
+    """
+    # Collect all valid shapes from this slide with absolute positions
+    shapes_with_positions = []
+    for shape in slide.shapes:  # type: ignore
+        shapes_with_positions.extend(collect_shapes_with_absolute_positions(shape))
+
+    if not shapes_with_positions:
+        return {}
+
+    # Convert to ShapeData with absolute positions and slide reference
+    shape_data_list = [
+        ShapeData(
+            swp.shape,
+            swp.absolute_left,
+            swp.absolute_top,
+            slide,
+            styles,
+        )
+        for swp in shapes_with_positions
+    ]
 
-        if not sorted_shapes:
-            continue
+    # Sort by visual position and assign stable IDs in one step
+    sorted_shapes = sort_shapes_by_position(shape_data_list)
+    for idx, shape_data in enumerate(sorted_shapes):
+        shape_data.shape_id = f"shape-{idx}"
 
-        # Create slide inventory using the stable shape IDs
-        inventory[f"slide-{slide_idx}"] = {
-            shape_data.shape_id: shape_data for shape_data in sorted_shapes
-        }
+    # Detect overlaps using the stable shape IDs
+    if len(sorted_shapes) > 1:
+        detect_overlaps(sorted_shapes)
 
+    # Filter for issues only if requested (after overlap detection)
+    if issues_only:
+        sorted_shapes = [sd for sd in sorted_shapes if sd.has_any_issues]
+
+    return {shape_data.shape_id: shape_data for shape_data in sorted_shapes}
+
+
+def _extract_inventory_slice(
+    pptx_path: Path, worker: int, workers: int, issues_only: bool
+) -> Dict[int, Dict[str, ShapeDict]]:
+    """Extract every workers-th slide, starting at slide index worker.
+
+    Runs in a worker process, so the presentation is opened here and the
+    shapes are returned as dictionaries, keyed by slide index.
+    """
+    prs = Presentation(str(pptx_path))
+    styles = StyleResolver(prs)
+    inventory = {}
+    for slide_idx, slide in enumerate(prs.slides):
+        if slide_idx % workers != worker:
+            continue
+        shapes = extract_slide_inventory(slide, styles, issues_only)
+        if shapes:
+            inventory[slide_idx] = {
+                shape_key: shape_data.to_dict()
+                for shape_key, shape_data in shapes.items()
+            }
     return inventory
 
 
-def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> InventoryDict:
+def get_inventory_as_dict(
+    pptx_path: Path, issues_only: bool = False, workers: int = 1
+) -> InventoryDict:
     """Extract text inventory and return as JSON-serializable dictionaries.
 
     This is a convenience wrapper around extract_text_inventory that returns
     dictionaries instead of ShapeData objects, useful for testing and direct
     JSON serialization.
 
+    With more than one worker, the slides are split between worker processes
+    that each open the presentation themselves; the result is the same as
+    extracting in this process.
+
     Args:
         pptx_path: Path to the PowerPoint file
         issues_only: If True, only include shapes that have overflow or overlap issues
+        workers: Number of worker processes (1 = extract in this process)
 
     Returns:
         Nested dictionary with all data serialized for JSON
     """
+    if workers > 1:
+        slides: Dict[int, Dict[str, ShapeDict]] = {}
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _extract_inventory_slice, pptx_path, worker, workers, issues_only
+                )
+                for worker in range(workers)
+            ]
+            for future in futures:
+                slides.update(future.result())
+        return {f"slide-{slide_idx}": slides[slide_idx] for slide_idx in sorted(slides)}
+
     inventory = extract_text_inventory(pptx_path, issues_only=issues_only)
 
     # Convert ShapeData objects to dictionaries
@@ -1000,16 +1280,24 @@ def get_inventory_as_dict(pptx_path: Path, issues_only: bool = False) -> Invento
     return dict_inventory
 
 
-def save_inventory(inventory: InventoryData, output_path: Path) -> None:
+def save_inventory(
+    inventory: Union[InventoryData, InventoryDict], output_path: Path
+) -> None:
     """Save inventory to JSON file with proper formatting.
 
-    Converts ShapeData objects to dictionaries for JSON serialization.
+    Converts ShapeData objects to dictionaries for JSON serialization; an
+    inventory from get_inventory_as_dict is saved as it is.
     """
     # Convert ShapeData objects to dictionaries
     json_inventory: InventoryDict = {}
     for slide_key, shapes in inventory.items():
         json_inventory[slide_key] = {
-            shape_key: shape_data.to_dict() for shape_key, shape_data in shapes.items()
+            shape_key: (
+                shape_data.to_dict()
+                if isinstance(shape_data, ShapeData)
+                else shape_data
+            )
+            for shape_key, shape_data in shapes.items()
         }
 
     with open(output_path, "w", encoding="utf-8") as f:
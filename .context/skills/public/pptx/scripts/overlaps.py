@@ -0,0 +1,133 @@
+"""
+Find the overlapping pairs among many axis-aligned rectangles.
+
+Shared by pptx/scripts/inventory.py and pdf/scripts/check_bounding_boxes.py;
+the two copies are kept identical.
+"""
+
+import bisect
+import heapq
+
+
+def find_overlaps(boxes, tolerance=0.0):
+    """Return every pair of boxes that overlap by more than tolerance on both axes.
+
+    Boxes are (x0, y0, x1, y1) with x0 <= x1 and y0 <= y1. Two boxes overlap
+    if min(x1) - max(x0) > tolerance and min(y1) - max(y0) > tolerance, which
+    is the same test as comparing them pairwise, so boxes without area never
+    overlap anything.
+
+    A sweep along x keeps the boxes crossing the sweep line in an interval
+    tree over y, so only pairs of boxes that intersect are ever compared:
+    the running time is O((n + k) log n) for n boxes and k intersecting pairs.
+
+    Args:
+        boxes: Sequence of (x0, y0, x1, y1) boxes
+        tolerance: Overlap (in box units) that doesn't count, must be >= 0
+
+    Returns:
+        list: (i, j, overlap_width, overlap_height) for each overlapping pair
+            of box indices i < j, sorted by i and then j
+    """
+    if tolerance < 0:
+        raise ValueError("tolerance must not be negative")
+
+    order = sorted(
+        (i for i, box in enumerate(boxes) if box[2] > box[0] and box[3] > box[1]),
+        key=lambda i: boxes[i][0],
+    )
+    active = _IntervalTree(sorted({boxes[i][k] for i in order for k in (1, 3)}))
+    ending = []  # Heap of (x1, index) of the boxes in active
+
+    pairs = []
+    for i in order:
+        x0, y0, x1, y1 = boxes[i]
+
+        # Boxes ending at or before x0 can't overlap this or any later box
+        while ending and ending[0][0] <= x0:
+            _, j = heapq.heappop(ending)
+            active.remove(j, boxes[j][1], boxes[j][3])
+
+        for j in active.query(y0, y1):
+            width = min(x1, boxes[j][2]) - max(x0, boxes[j][0])
+            height = min(y1, boxes[j][3]) - max(y0, boxes[j][1])
+            if width > tolerance and height > tolerance:
+                pairs.append((min(i, j), max(i, j), width, height))
+
+        active.add(i, y0, y1)
+        heapq.heappush(ending, (x1, i))
+
+    pairs.sort()
+    return pairs
+
+
+class _IntervalTree:
+    """Changing set of half-open intervals [lo, hi) over a fixed set of endpoints.
+
+    A segment tree over the endpoints answers which intervals contain a
+    point, and a sorted list of interval starts which intervals start within
+    a range; together they report the intervals intersecting a query
+    interval in time proportional to the number reported.
+    """
+
+    def __init__(self, coords):
+        self.coords = coords
+        # Slot s is [coords[s], coords[s + 1])
+        self.slots = max(len(coords) - 1, 1)
+        self.nodes = [set() for _ in range(4 * self.slots)]
+        self.starts = []  # Sorted (lo, key) of all intervals
+
+    def add(self, key, lo, hi):
+        self._update(1, 0, self.slots, self._slot(lo), self._slot(hi), key, True)
+        bisect.insort(self.starts, (lo, key))
+
+    def remove(self, key, lo, hi):
+        self._update(1, 0, self.slots, self._slot(lo), self._slot(hi), key, False)
+        del self.starts[bisect.bisect_left(self.starts, (lo, key))]
+
+    def query(self, lo, hi):
+        """Return the keys of the intervals with start < hi and end > lo."""
+        found = []
+
+        # Intervals containing lo...
+        slot = self._slot(lo)
+        if 0 <= slot < len(self.coords) - 1:
+            node, node_lo, node_hi = 1, 0, self.slots
+            while True:
+                found.extend(self.nodes[node])
+                if node_hi - node_lo == 1:
+                    break
+                mid = (node_lo + node_hi) // 2
+                if slot < mid:
+                    node, node_hi = 2 * node, mid
+                else:
+                    node, node_lo = 2 * node + 1, mid
+
+        # ...and intervals starting after lo but before hi
+        index = bisect.bisect_right(self.starts, (lo, float("inf")))
+        while index < len(self.starts) and self.starts[index][0] < hi:
+            found.append(self.starts[index][1])
+            index += 1
+
+        return found
+
+    def _slot(self, value):
+        return bisect.bisect_right(self.coords, value) - 1
+
+    def _update(self, node, node_lo, node_hi, lo, hi, key, add):
+        """Add key to (or remove it from) the nodes covering slots [lo, hi)."""
+        if hi <= node_lo or node_hi <= lo:
+            return
+        if lo <= node_lo and node_hi <= hi:
+            if add:
+                self.nodes[node].add(key)
+            else:
+                self.nodes[node].discard(key)
+            return
+        mid = (node_lo + node_hi) // 2
+        self._update(2 * node, node_lo, mid, lo, hi, key, add)
+        self._update(2 * node + 1, mid, node_hi, lo, hi, key, add)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
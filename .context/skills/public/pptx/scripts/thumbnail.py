@@ -46,6 +46,7 @@ import sys
 import tempfile
 from pathlib import Path
 
+import soffice
 from inventory import extract_text_inventory
 from PIL import Image, ImageDraw, ImageFont
 from pptx import Presentation
@@ -212,25 +213,12 @@ def convert_to_images(pptx_path, temp_dir, dpi):
     if hidden_slides:
         print(f"Hidden slides: {sorted(hidden_slides)}")
 
-    pdf_path = temp_dir / f"{pptx_path.stem}.pdf"
-
     # Convert to PDF
     print("Converting to PDF...")
-    result = subprocess.run(
-        [
-            "soffice",
-            "--headless",
-            "--convert-to",
-            "pdf",
-            "--outdir",
-            str(temp_dir),
-            str(pptx_path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0 or not pdf_path.exists():
-        raise RuntimeError("PDF conversion failed")
+    try:
+        pdf_path = soffice.convert(pptx_path, temp_dir, "pdf")
+    except RuntimeError as e:
+        raise RuntimeError("PDF conversion failed") from e
 
     # Convert PDF to images
     print(f"Converting to images at {dpi} DPI...")
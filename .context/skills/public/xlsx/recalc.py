@@ -14,6 +14,8 @@ from pathlib import Path
 
 from openpyxl import load_workbook
 
+import soffice
+
 # Platform-specific LibreOffice macro directory
 MACRO_DIR_MACOS = "~/Library/Application Support/LibreOffice/4/user/basic/Standard"
 MACRO_DIR_LINUX = "~/.config/libreoffice/4/user/basic/Standard"
@@ -127,6 +129,16 @@ def recalc(filename, timeout=30):
 
     abs_path = str(Path(filename).absolute())
 
+    if soffice.HAVE_UNO:
+        # Recalculate in a persistent LibreOffice worker (no macro needed)
+        try:
+            soffice.recalculate(abs_path, timeout=timeout)
+        except TimeoutError:
+            return {"error": f"Recalculation timed out after {timeout}s"}
+        except Exception as e:
+            return {"error": f"Recalculation failed: {e}"}
+        return check_formula_errors(filename)
+
     if not setup_libreoffice_macro():
         return {"error": "Failed to setup LibreOffice macro"}
 
@@ -155,6 +167,15 @@ def recalc(filename, timeout=30):
             return {"error": "LibreOffice macro not configured properly"}
         return {"error": error_msg}
 
+    return check_formula_errors(filename)
+
+
+def check_formula_errors(filename):
+    """Scan a recalculated Excel file for formula errors and count its formulas.
+
+    Returns:
+        dict with error locations and counts
+    """
     # Check for Excel errors in the recalculated file - scan ALL cells
     try:
         wb = load_workbook(filename, data_only=True)